@@ -0,0 +1,66 @@
+"""Сравнение стратегий генерации лабиринта.
+
+Запуск из корня репозитория:
+    python -m benchmarks.maze_generators [размер] [seed]
+"""
+import sys
+import time
+
+from src.model.generators import (
+    KruskalMazeGenerator,
+    MazeGenerator,
+    MazeLayout,
+    RecursiveDivisionMazeGenerator,
+    UniformMazeGenerator,
+    WilsonMazeGenerator,
+)
+from src.model.interface import BoundaryKind
+from src.model.tiled_generators import TiledMazeGenerator
+
+
+def count_dead_ends(layout: MazeLayout) -> int:
+    """Комнаты, из которых есть только один выход."""
+    exits = bytearray(layout.size * layout.size)
+    for index in range(layout.boundaries_amount):
+        if layout.kinds[index] == BoundaryKind.WALL:
+            continue
+        room_1, room_2 = layout.get_rooms(index)
+        exits[room_1] += 1
+        exits[room_2] += 1
+    return exits.count(1)
+
+
+def run(generator: MazeGenerator, size: int) -> None:
+    start = time.perf_counter()
+    layout = generator.generate(size)
+    elapsed = time.perf_counter() - start
+
+    amount = max(layout.boundaries_amount, 1)
+    print(
+        f"{type(generator).__name__:<32}"
+        f"{elapsed:>9.3f} с"
+        f"{size * size / max(elapsed, 1e-9) / 1000:>10.1f} тыс. комнат/с"
+        f"{layout.count(BoundaryKind.WALL) * 100 / amount:>8.1f}% стен"
+        f"{layout.count(BoundaryKind.PORTAL) * 100 / amount:>8.1f}% порталов"
+        f"{layout.count_components():>10} компонент"
+        f"{count_dead_ends(layout):>10} тупиков"
+    )
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    print(f"Размер уровня: {size}x{size}")
+    for generator in (
+        UniformMazeGenerator(seed=seed),
+        KruskalMazeGenerator(seed=seed),
+        WilsonMazeGenerator(seed=seed),
+        RecursiveDivisionMazeGenerator(seed=seed),
+        TiledMazeGenerator(seed=seed),
+    ):
+        run(generator, size)
+
+
+if __name__ == "__main__":
+    main()
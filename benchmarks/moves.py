@@ -0,0 +1,92 @@
+"""Сравнение обычных ходов и одновременных ходов через MoveQueue.
+
+Запуск из корня репозитория:
+    python -m benchmarks.moves [количество персонажей] [размер уровня] [ходов]
+
+Порталы печатают сообщения при каждой попытке открыться, поэтому вывод игры
+лучше отправить в /dev/null, результаты печатаются в stderr.
+"""
+import random
+import sys
+import time
+
+from src.model.game_objects import Character
+from src.model.generators import KruskalMazeGenerator
+from src.model.interface import Direction
+from src.model.level import Level, PortalsKeeper
+from src.model.moves import MoveQueue, TransitionTable
+
+REPEATS = 5
+
+
+def create_game(
+    characters_amount: int,
+    size: int,
+    ticks: int
+) -> tuple[list[Character], Level, PortalsKeeper, list[list[Direction]]]:
+    characters = [Character(f"Character {number}") for number in range(characters_amount)]
+    portals_keeper = PortalsKeeper()
+    level = Level(
+        size, characters[0], characters[1], portals_keeper, KruskalMazeGenerator(seed=1)
+    )
+
+    rnd = random.Random(3)
+    for character in characters:
+        character.change_room(level.rooms[rnd.randrange(size)][rnd.randrange(size)])
+    plan = [[Direction(rnd.randrange(4)) for _ in characters] for _ in range(ticks)]
+    return characters, level, portals_keeper, plan
+
+
+def measure_sequential(characters_amount: int, size: int, ticks: int) -> float:
+    characters, _, portals_keeper, plan = create_game(characters_amount, size, ticks)
+    moves = {
+        Direction.UP: Character.try_to_go_up,
+        Direction.RIGHT: Character.try_to_go_right,
+        Direction.DOWN: Character.try_to_go_down,
+        Direction.LEFT: Character.try_to_go_left,
+    }
+
+    elapsed = 0.0
+    for directions in plan:
+        start = time.perf_counter()
+        for character, direction in zip(characters, directions):
+            moves[direction](character)
+        elapsed += time.perf_counter() - start
+        portals_keeper.try_to_open_portals()
+    return elapsed
+
+
+def measure_queue(characters_amount: int, size: int, ticks: int) -> float:
+    characters, level, portals_keeper, plan = create_game(characters_amount, size, ticks)
+    move_queue = MoveQueue(TransitionTable(level.rooms))
+
+    elapsed = 0.0
+    for directions in plan:
+        start = time.perf_counter()
+        for character, direction in zip(characters, directions):
+            move_queue.submit(character, direction)
+        move_queue.resolve()
+        elapsed += time.perf_counter() - start
+        portals_keeper.try_to_open_portals()
+    return elapsed
+
+
+def main():
+    characters_amount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    moves_amount = characters_amount * ticks
+
+    for name, measure in (
+        ("По очереди", measure_sequential),
+        ("MoveQueue", measure_queue),
+    ):
+        elapsed = min(measure(characters_amount, size, ticks) for _ in range(REPEATS))
+        print(
+            f"{name:<16}{elapsed:>9.3f} с{elapsed * 1e6 / moves_amount:>9.2f} мкс/ход",
+            file=sys.stderr
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Время запуска игры: от старта процесса до первой отрисовки уровня.
+
+Запуск из корня репозитория:
+    python -m benchmarks.startup [количество запусков] [команда запуска игры...]
+
+Без команды запускается `python main.py`. Для собранной игры передайте путь
+к исполняемому файлу, например dist/room-runers-v0.2.0/room-runers-v0.2.0.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from main import STARTUP_PROBE_VARIABLE
+
+
+def measure(command: list[str]) -> float:
+    environment = dict(os.environ, **{STARTUP_PROBE_VARIABLE: "1"})
+    start = time.time()
+    result = subprocess.run(
+        command,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+
+    for line in result.stdout.splitlines():
+        if line.startswith(f"{STARTUP_PROBE_VARIABLE}="):
+            return float(line.split("=", 1)[1]) - start
+
+    raise RuntimeError(f"Игра не сообщила о первой отрисовке уровня:\n{result.stderr}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    command = sys.argv[2:] or [sys.executable, "main.py"]
+
+    times = [measure(command) for _ in range(runs)]
+    print(f"Команда: {' '.join(command)}")
+    print(
+        f"До первой отрисовки: медиана {statistics.median(times) * 1000:.1f} мс, "
+        f"мин. {min(times) * 1000:.1f} мс, макс. {max(times) * 1000:.1f} мс"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,59 @@
+"""Сборка игры.
+
+    python build.py               - один исполняемый файл (--onefile);
+    python build.py --fast-start  - распакованная папка (--onedir) с набором готовых
+                                    уровней и без неиспользуемых модулей. Такая сборка
+                                    не распаковывает себя при каждом запуске и не
+                                    генерирует уровень.
+"""
+import os
 import subprocess
+import sys
+
+from main import LEVEL_PACK_NAME, VERSION
+from src.model.level_pack import build_level_pack
+
+LEVEL_PACK_SIZE = 10
+LEVEL_PACK_AMOUNT = 200
+EXCLUDED_MODULES = [
+    "tkinter",
+    "unittest",
+    "doctest",
+    "pydoc",
+    "pygame",
+    "xml",
+    "email",
+    "http",
+    "multiprocessing",
+    "concurrent",
+]
+
+
+def build_onefile():
+    subprocess.call(f"pyinstaller --onefile main.py --name room-runers-v{VERSION}")
+
+
+def build_fast_start():
+    build_level_pack(LEVEL_PACK_NAME, LEVEL_PACK_SIZE, LEVEL_PACK_AMOUNT)
+
+    command = [
+        "pyinstaller",
+        "--onedir",
+        "--noconfirm",
+        "main.py",
+        "--name",
+        f"room-runers-v{VERSION}",
+        "--add-data",
+        f"{LEVEL_PACK_NAME}{os.pathsep}.",
+    ]
+    for module in EXCLUDED_MODULES:
+        command.extend(["--exclude-module", module])
+
+    subprocess.call(command)
 
-from main import VERSION
 
-subprocess.call(f"pyinstaller --onefile main.py --name room-runers-v{VERSION}")
+if __name__ == "__main__":
+    if "--fast-start" in sys.argv:
+        build_fast_start()
+    else:
+        build_onefile()
@@ -1,11 +1,78 @@
+from typing import Optional
+import argparse
+import os
+import random
+import sys
+import time
+
+from src.model.events import EventBus, GameOverEvent, PortalFiredEvent
 from src.model.game_objects import Character, GameRules, Timer
+from src.model.generators import MazeGenerator, PrecomputedMazeGenerator, UniformMazeGenerator
 from src.model.level import Level, PortalsKeeper
+from src.model.level_pack import LevelPack
 from src.view import LevelView, Controller
 
 VERSION = "0.2.0"
+LEVEL_PACK_NAME = "levels.pack"
+# Если переменная окружения задана, игра печатает время первой отрисовки уровня
+# и завершается. Используется в benchmarks/startup.py.
+STARTUP_PROBE_VARIABLE = "ROOM_RUNERS_STARTUP_PROBE"
+
+
+def get_resource_path(name: str) -> str:
+    """Путь к файлу рядом с программой, в том числе в сборке PyInstaller."""
+    base_path = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, name)
+
+
+def load_maze_generator(size: int) -> MazeGenerator | None:
+    """Взять случайный готовый уровень из набора, если набор есть."""
+    path = get_resource_path(LEVEL_PACK_NAME)
+    if not os.path.exists(path):
+        return None
+
+    with LevelPack(path) as level_pack:
+        indexes = level_pack.find_indexes(size)
+        if not indexes:
+            return None
+        index = random.choice(indexes)
+        return PrecomputedMazeGenerator(level_pack.get_layout(index), level_pack.get_seed(index))
+
+
+def parse_options(arguments: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=f"room-runers-v{VERSION}")
+    parser.add_argument(
+        "--fog-of-war",
+        action="store_true",
+        help="персонаж видит только комнаты в прямой видимости",
+    )
+    parser.add_argument(
+        "--simultaneous-moves",
+        action="store_true",
+        help="ходы обоих персонажей применяются одновременно в конце хода",
+    )
+    parser.add_argument(
+        "--spectators-port",
+        type=int,
+        metavar="PORT",
+        help="транслировать игру локальным зрителям по TCP на этом порту",
+    )
+    parser.add_argument(
+        "--results-file",
+        metavar="PATH",
+        help="дописывать результат матча в хранилище результатов по этому пути",
+    )
+    return parser.parse_args(arguments)
+
+
+def report_startup() -> None:
+    print(f"{STARTUP_PROBE_VARIABLE}={time.time()}", flush=True)
+    os._exit(0)
+
 
+def main(arguments: Optional[list[str]] = None):
+    options = parse_options(arguments)
 
-def main():
     character_1 = Character("Ripley")
     character_2 = Character("Alien")
 
@@ -15,15 +82,74 @@ def main():
     portals_keeper = PortalsKeeper()
 
     size = 10
-    level = Level(size, character_1, character_2, portals_keeper)
+    maze_generator = load_maze_generator(size) or UniformMazeGenerator(
+        seed=random.randrange(2 ** 32)
+    )
+    level = Level(size, character_1, character_2, portals_keeper, maze_generator)
 
     controller_1 = Controller(character_1)
     controller_2 = Controller(character_2)
 
+    # Модули необязательных режимов импортируются, только если режим включён,
+    # чтобы не замедлять запуск.
+    if options.fog_of_war:
+        from src.model.visibility import CharacterVisibility, SightSpansCache
+
+        spans_cache = SightSpansCache()
+        controller_1.visibility = CharacterVisibility(character_1, spans_cache)
+        controller_2.visibility = CharacterVisibility(character_2, spans_cache)
+
     w = LevelView(level, portals_keeper, game_timer, controller_1, controller_2)
     w.characters_encounter_delegate = game_rules.check_characters_encounter
     w.game_times_up = game_rules.check_times_up
-    w.show()
+    if os.environ.get(STARTUP_PROBE_VARIABLE):
+        w.level_drawn = report_startup
+
+    if options.simultaneous_moves:
+        from src.model.moves import MoveQueue, TransitionTable
+
+        move_queue = MoveQueue(TransitionTable(level.rooms))
+        controller_1.move_queue = move_queue
+        controller_2.move_queue = move_queue
+        w.move_queue = move_queue
+
+    event_bus = EventBus()
+    event_bus.attach([character_1, character_2], portals_keeper.portals, [game_timer])
+    w.tick_finished = event_bus.flush
+    w.game_finished = event_bus.publish_game_over
+
+    spectator_server = None
+    if options.spectators_port is not None:
+        from src.spectator import SpectatorBroadcaster, SpectatorServer
+
+        spectator_broadcaster = SpectatorBroadcaster(
+            level, portals_keeper, game_timer, [character_1, character_2]
+        )
+        spectator_server = SpectatorServer(spectator_broadcaster, options.spectators_port)
+        event_bus.subscribe(spectator_server.on_events)
+        host, port = spectator_server.address
+        print(f"Трансляция для зрителей: {host}:{port}")
+
+    results_writer = None
+    if options.results_file:
+        from src.results import MatchRecorder, ResultsWriter
+
+        results_writer = ResultsWriter(options.results_file)
+        match_recorder = MatchRecorder(
+            results_writer, level, maze_generator.seed, game_rules, game_timer, character_1
+        )
+        event_bus.subscribe(match_recorder.on_events, PortalFiredEvent, GameOverEvent)
+
+    try:
+        w.show()
+    finally:
+        if spectator_server is not None:
+            spectator_server.close()
+        if results_writer is not None:
+            try:
+                results_writer.close()
+            except OSError as error:
+                print(f"Не удалось сохранить результат матча: {error}")
 
 
 if __name__ == "__main__":
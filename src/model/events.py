@@ -0,0 +1,147 @@
+"""Поток событий об изменениях модели.
+
+Персонажи, порталы и таймеры сообщают об изменениях через свои делегаты.
+EventBus подключается к этим делегатам, складывает события в пакет текущего хода
+и раздаёт пакет подписчикам при вызове flush (один раз в конце хода).
+
+Подписчики (отрисовка, боты, телеметрия) получают только то, что изменилось,
+и не обходят весь уровень каждый ход.
+
+Делегат у объекта модели один, и подключается к нему только шина: attach выбрасывает
+ValueError, если делегат уже занят. Остальные потребители подписываются на шину.
+"""
+from typing import Any, Callable, Optional
+
+from .interface import ICharacter, IRoom, ITimer
+from .level import Portal
+
+
+class Event:
+    pass
+
+
+class CharacterMovedEvent(Event):
+    def __init__(self, character: ICharacter, previous_room: Optional[IRoom], room: IRoom):
+        self.character = character
+        self.previous_room = previous_room
+        self.room = room
+
+
+class PortalArmedEvent(Event):
+    """Персонаж вошёл в портал и таймер портала запущен."""
+    def __init__(self, portal: Portal):
+        self.portal = portal
+
+
+class PortalFiredEvent(Event):
+    """Портал перенёс персонажа в другую комнату."""
+    def __init__(self, portal: Portal):
+        self.portal = portal
+
+
+class TimerTickedEvent(Event):
+    def __init__(self, timer: ITimer):
+        self.timer = timer
+
+
+class GameOverEvent(Event):
+    def __init__(self, surrendered_character: Optional[ICharacter] = None):
+        # Персонаж, который сдался, или None, если игра закончилась по правилам.
+        self.surrendered_character = surrendered_character
+
+
+EventsHandler = Callable[[list[Event]], None]
+
+
+class EventBus:
+    def __init__(self):
+        self._events: list[Event] = []
+        self._subscribers: list[tuple[EventsHandler, tuple[type[Event], ...]]] = []
+
+    @property
+    def pending_events(self) -> list[Event]:
+        return self._events
+
+    def subscribe(self, handler: EventsHandler, *event_types: type[Event]) -> None:
+        """Подписаться на пакеты событий. Если типы не указаны, приходят все события."""
+        self._subscribers.append((handler, event_types))
+
+    def unsubscribe(self, handler: EventsHandler) -> None:
+        self._subscribers = [
+            subscriber
+            for subscriber in self._subscribers
+            if subscriber[0] != handler
+        ]
+
+    def attach(
+        self,
+        characters: list[ICharacter],
+        portals: list[Portal],
+        timers: list[ITimer]
+    ) -> None:
+        """Подключиться к делегатам объектов модели."""
+        for character in characters:
+            self._check_delegate_is_free(character.room_changed_delegate, character)
+        for portal in portals:
+            self._check_delegate_is_free(portal.armed_delegate, portal)
+            self._check_delegate_is_free(portal.character_passed_delegate, portal)
+        for timer in timers:
+            self._check_delegate_is_free(timer.ticked_delegate, timer)
+
+        for character in characters:
+            character.room_changed_delegate = self._on_character_moved
+        for portal in portals:
+            portal.armed_delegate = self._on_portal_armed
+            portal.character_passed_delegate = self._on_portal_fired
+        for timer in timers:
+            timer.ticked_delegate = self._on_timer_ticked
+
+    def publish(self, event: Event) -> None:
+        self._events.append(event)
+
+    def publish_game_over(self, surrendered_character: Optional[ICharacter] = None) -> None:
+        self.publish(GameOverEvent(surrendered_character))
+        self.flush()
+
+    def flush(self) -> None:
+        """Раздать подписчикам события, накопленные за ход.
+        Подписчики без фильтра получают пакет каждый ход, даже пустой.
+        """
+        events = self._events
+        self._events = []
+
+        for handler, event_types in self._subscribers:
+            if not event_types:
+                handler(events)
+                continue
+
+            selected = [event for event in events if isinstance(event, event_types)]
+            if selected:
+                handler(selected)
+
+    def _check_delegate_is_free(
+        self,
+        delegate: Optional[Callable[..., None]],
+        model_object: Any
+    ) -> None:
+        if delegate is not None and getattr(delegate, "__self__", None) is not self:
+            raise ValueError(
+                f"Делегат объекта {model_object} уже занят, подпишитесь на EventBus."
+            )
+
+    def _on_character_moved(
+        self,
+        character: ICharacter,
+        previous_room: Optional[IRoom],
+        room: IRoom
+    ) -> None:
+        self.publish(CharacterMovedEvent(character, previous_room, room))
+
+    def _on_portal_armed(self, portal: Portal) -> None:
+        self.publish(PortalArmedEvent(portal))
+
+    def _on_portal_fired(self, portal: Portal) -> None:
+        self.publish(PortalFiredEvent(portal))
+
+    def _on_timer_ticked(self, timer: ITimer) -> None:
+        self.publish(TimerTickedEvent(timer))
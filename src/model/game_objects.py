@@ -1,3 +1,5 @@
+from typing import Callable, Optional
+
 from .interface import ICharacter, IRoom, ITimer
 
 
@@ -5,14 +7,21 @@ class Character(ICharacter):
     def __init__(self, name: str):
         self.name = name
         self._room = None
+        self.room_changed_delegate: Optional[
+            Callable[[ICharacter, Optional[IRoom], IRoom], None]
+        ] = None
 
     @property
     def current_room(self):
         return self._room
 
     def change_room(self, room: IRoom):
+        previous_room = self._room
         self._room = room
 
+        if self.room_changed_delegate:
+            self.room_changed_delegate(self, previous_room, room)
+
     def try_to_go_up(self):
         if self._room:
             self._room.try_to_release_character_up(self)
@@ -35,6 +44,7 @@ class Timer(ITimer):
         self._end_time = amount_of_time
         self._current_time = 0
         self._is_active = False
+        self.ticked_delegate: Optional[Callable[[ITimer], None]] = None
 
     @property
     def is_active(self):
@@ -58,6 +68,9 @@ class Timer(ITimer):
         if self._is_active:
             self._current_time += 1
 
+            if self.ticked_delegate:
+                self.ticked_delegate(self)
+
     def reset(self):
         self._current_time = 0
         self._is_active = False
@@ -0,0 +1,298 @@
+"""Стратегии генерации лабиринта.
+
+Генератор не создаёт комнаты и перегородки, а только решает, какого типа будет каждая
+внутренняя перегородка уровня. Результат хранится в MazeLayout в виде массива байт,
+по одному байту (BoundaryKind) на перегородку. Комнаты и объекты перегородок по этой
+раскладке строит Level.
+
+Нумерация внутренних перегородок:
+- сначала вертикальные, между комнатами (x, y) и (x + 1, y): индекс y * (size - 1) + x;
+- затем горизонтальные, между комнатами (x, y) и (x, y + 1): индекс
+  size * (size - 1) + y * size + x.
+
+Все алгоритмы, кроме равномерного, сначала строят остовное дерево проходов, поэтому
+из любой комнаты можно попасть в любую другую. Затем стены ставятся только на
+перегородки вне дерева, пока не наберётся нужный процент стен, а проходы делятся
+на двери и порталы в заданной пропорции.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+import random
+
+from .interface import BoundaryKind
+
+
+class MazeLayout:
+    def __init__(self, size: int, kinds: Optional[bytearray | memoryview] = None):
+        self.size = size
+        self.vertical_amount = size * (size - 1)
+        self.boundaries_amount = 2 * self.vertical_amount
+        if kinds is None:
+            kinds = bytearray(self.boundaries_amount)
+        self.kinds = kinds
+
+    def vertical_index(self, x: int, y: int) -> int:
+        """Индекс перегородки справа от комнаты (x, y)."""
+        return y * (self.size - 1) + x
+
+    def horizontal_index(self, x: int, y: int) -> int:
+        """Индекс перегородки снизу от комнаты (x, y)."""
+        return self.vertical_amount + y * self.size + x
+
+    def get_rooms(self, index: int) -> tuple[int, int]:
+        """Номера комнат (y * size + x), которые разделяет перегородка."""
+        if index < self.vertical_amount:
+            y, x = divmod(index, self.size - 1)
+            room = y * self.size + x
+            return room, room + 1
+
+        room = index - self.vertical_amount
+        return room, room + self.size
+
+    def get_kind(self, index: int) -> BoundaryKind:
+        return BoundaryKind(self.kinds[index])
+
+    def count(self, kind: BoundaryKind) -> int:
+        if isinstance(self.kinds, memoryview):
+            return self.kinds[:self.boundaries_amount].tobytes().count(kind)
+        return self.kinds.count(kind)
+
+    def count_components(self) -> int:
+        """Количество групп комнат, между которыми нет прохода."""
+        parents = list(range(self.size * self.size))
+
+        def find(room: int) -> int:
+            while parents[room] != room:
+                parents[room] = parents[parents[room]]
+                room = parents[room]
+            return room
+
+        components = len(parents)
+        for index in range(self.boundaries_amount):
+            if self.kinds[index] == BoundaryKind.WALL:
+                continue
+            room_1, room_2 = self.get_rooms(index)
+            root_1, root_2 = find(room_1), find(room_2)
+            if root_1 != root_2:
+                parents[root_1] = root_2
+                components -= 1
+
+        return components
+
+
+class MazeGenerator(ABC):
+    def __init__(
+        self,
+        walls_percent: int = 20,
+        portals_percent: int = 40,
+        seed: Optional[int] = None
+    ):
+        if walls_percent + portals_percent > 100:
+            raise ValueError("Сумма процентов стен и порталов не может быть больше 100.")
+
+        self._walls_percent = walls_percent
+        self._portals_percent = portals_percent
+        self._seed = seed
+        self._random = random.Random(seed)
+
+    @property
+    def seed(self) -> Optional[int]:
+        return self._seed
+
+    def generate(self, size: int) -> MazeLayout:
+        layout = MazeLayout(size)
+        if layout.boundaries_amount == 0:
+            return layout
+
+        tree = self._build_passages_tree(layout)
+        self._arrange_kinds(layout, tree)
+        return layout
+
+    def _calculate_walls_amount(self, layout: MazeLayout) -> int:
+        return layout.boundaries_amount * self._walls_percent // 100
+
+    def _choose_passage_kind(self) -> BoundaryKind:
+        passages_percent = 100 - self._walls_percent
+        if self._random.random() * passages_percent < self._portals_percent:
+            return BoundaryKind.PORTAL
+        return BoundaryKind.DOOR
+
+    @abstractmethod
+    def _build_passages_tree(self, layout: MazeLayout) -> bytearray:
+        """Вернуть флаги перегородок, образующих остовное дерево проходов."""
+        ...
+
+    def _arrange_kinds(self, layout: MazeLayout, tree: bytearray) -> None:
+        candidates = [index for index in range(layout.boundaries_amount) if not tree[index]]
+        walls_amount = min(self._calculate_walls_amount(layout), len(candidates))
+        walls = set(self._random.sample(candidates, walls_amount))
+
+        kinds = layout.kinds
+        for index in range(layout.boundaries_amount):
+            if index in walls:
+                kinds[index] = BoundaryKind.WALL
+            else:
+                kinds[index] = self._choose_passage_kind()
+
+
+class PrecomputedMazeGenerator(MazeGenerator):
+    """Отдаёт готовую раскладку, например загруженную из набора уровней."""
+    def __init__(self, layout: MazeLayout, seed: Optional[int] = None):
+        super().__init__(seed=seed)
+        self._layout = layout
+
+    def generate(self, size: int) -> MazeLayout:
+        if size != self._layout.size:
+            raise ValueError(
+                f"Размер уровня {size} не совпадает с размером раскладки {self._layout.size}."
+            )
+        return self._layout
+
+    def _build_passages_tree(self, layout: MazeLayout) -> bytearray:
+        return bytearray(layout.boundaries_amount)
+
+
+class UniformMazeGenerator(MazeGenerator):
+    """Правило прежнего BoundaryGenerator: тип каждой перегородки выбирается независимо,
+    стена выпадает с вероятностью 1/3, иначе выбирается дверь или портал (при стандартных
+    процентах равновероятно). Выпавшая стена отбрасывается, если стен уже больше
+    walls_percent процентов. Связность не гарантируется.
+    """
+    def generate(self, size: int) -> MazeLayout:
+        layout = MazeLayout(size)
+        kinds = layout.kinds
+        walls_amount = 0
+
+        for index in range(layout.boundaries_amount):
+            if (
+                self._random.randrange(3) == 0
+                and walls_amount * 100 <= layout.boundaries_amount * self._walls_percent
+            ):
+                kinds[index] = BoundaryKind.WALL
+                walls_amount += 1
+            else:
+                kinds[index] = self._choose_passage_kind()
+
+        return layout
+
+    def _build_passages_tree(self, layout: MazeLayout) -> bytearray:
+        return bytearray(layout.boundaries_amount)
+
+
+class KruskalMazeGenerator(MazeGenerator):
+    """Алгоритм Краскала на системе непересекающихся множеств."""
+    def _build_passages_tree(self, layout: MazeLayout) -> bytearray:
+        tree = bytearray(layout.boundaries_amount)
+        parents = list(range(layout.size * layout.size))
+
+        order = list(range(layout.boundaries_amount))
+        self._random.shuffle(order)
+
+        for index in order:
+            room_1, room_2 = layout.get_rooms(index)
+            root_1 = self._find(parents, room_1)
+            root_2 = self._find(parents, room_2)
+            if root_1 != root_2:
+                parents[root_1] = root_2
+                tree[index] = 1
+
+        return tree
+
+    @staticmethod
+    def _find(parents: list[int], room: int) -> int:
+        while parents[room] != room:
+            parents[room] = parents[parents[room]]
+            room = parents[room]
+        return room
+
+
+class WilsonMazeGenerator(MazeGenerator):
+    """Алгоритм Уилсона: случайные блуждания со стиранием петель.
+    Даёт равномерно распределённое остовное дерево.
+    """
+    def _build_passages_tree(self, layout: MazeLayout) -> bytearray:
+        size = layout.size
+        rooms_amount = size * size
+        tree = bytearray(layout.boundaries_amount)
+        in_tree = bytearray(rooms_amount)
+        next_room = [0] * rooms_amount
+        next_boundary = [0] * rooms_amount
+
+        in_tree[self._random.randrange(rooms_amount)] = 1
+
+        for start in range(rooms_amount):
+            if in_tree[start]:
+                continue
+
+            # Блуждание запоминает только последний выход из каждой комнаты,
+            # поэтому петли стираются сами собой.
+            room = start
+            while not in_tree[room]:
+                neighbour, boundary = self._random_step(layout, room)
+                next_room[room] = neighbour
+                next_boundary[room] = boundary
+                room = neighbour
+
+            room = start
+            while not in_tree[room]:
+                in_tree[room] = 1
+                tree[next_boundary[room]] = 1
+                room = next_room[room]
+
+        return tree
+
+    def _random_step(self, layout: MazeLayout, room: int) -> tuple[int, int]:
+        size = layout.size
+        y, x = divmod(room, size)
+
+        while True:
+            direction = self._random.randrange(4)
+            if direction == 0 and y > 0:
+                return room - size, layout.horizontal_index(x, y - 1)
+            if direction == 1 and x < size - 1:
+                return room + 1, layout.vertical_index(x, y)
+            if direction == 2 and y < size - 1:
+                return room + size, layout.horizontal_index(x, y)
+            if direction == 3 and x > 0:
+                return room - 1, layout.vertical_index(x - 1, y)
+
+
+class RecursiveDivisionMazeGenerator(MazeGenerator):
+    """Рекурсивное деление: поле делится стеной с одним проходом, пока
+    отсеки не станут шириной в одну комнату. Рекурсия заменена стеком.
+    """
+    def _build_passages_tree(self, layout: MazeLayout) -> bytearray:
+        tree = bytearray(b"\x01" * layout.boundaries_amount)
+        chambers = [(0, 0, layout.size, layout.size)]
+
+        while chambers:
+            x, y, width, height = chambers.pop()
+            if width < 2 or height < 2:
+                continue
+
+            if self._is_horizontal_cut(width, height):
+                # Стена между рядами y + cut - 1 и y + cut.
+                cut = self._random.randrange(1, height)
+                gap = x + self._random.randrange(width)
+                for wall_x in range(x, x + width):
+                    if wall_x != gap:
+                        tree[layout.horizontal_index(wall_x, y + cut - 1)] = 0
+                chambers.append((x, y, width, cut))
+                chambers.append((x, y + cut, width, height - cut))
+            else:
+                cut = self._random.randrange(1, width)
+                gap = y + self._random.randrange(height)
+                for wall_y in range(y, y + height):
+                    if wall_y != gap:
+                        tree[layout.vertical_index(x + cut - 1, wall_y)] = 0
+                chambers.append((x, y, cut, height))
+                chambers.append((x + cut, y, width - cut, height))
+
+        return tree
+
+    def _is_horizontal_cut(self, width: int, height: int) -> bool:
+        if width < height:
+            return True
+        if height < width:
+            return False
+        return self._random.random() < 0.5
@@ -1,5 +1,5 @@
-from enum import Enum
-from typing import Protocol, ForwardRef, Optional
+from enum import Enum, IntEnum
+from typing import Callable, Protocol, ForwardRef, Optional
 
 
 IRoom = ForwardRef("IRoom")  # type: ignore
@@ -10,8 +10,25 @@ class BoundaryPosition(Enum):
     VERTICAL = 1
 
 
+class Direction(IntEnum):
+    UP = 0
+    RIGHT = 1
+    DOWN = 2
+    LEFT = 3
+
+
+class BoundaryKind(IntEnum):
+    """Компактный код типа перегородки для хранения лабиринта в массивах байт."""
+    WALL = 0
+    DOOR = 1
+    PORTAL = 2
+
+
 class ICharacter(Protocol):
     name: str
+    room_changed_delegate: Optional[
+        Callable[["ICharacter", Optional[IRoom], IRoom], None]
+    ]
 
     @property
     def current_room(self) -> Optional[IRoom]:
@@ -141,6 +158,8 @@ class ILevel(Protocol):
 
 
 class ITimer:
+    ticked_delegate: Optional[Callable[["ITimer"], None]]
+
     @property
     def is_active(self) -> bool:
         ...
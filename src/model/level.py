@@ -14,11 +14,14 @@
     3.3 Если ограждение - это портал, то игрок перейдёт в другую комнату через некоторое время.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 import random
 
-from .interface import IBoundary, BoundaryPosition, ICharacter, IRoom, ILevel, ITimer
+from .interface import (
+    IBoundary, BoundaryKind, BoundaryPosition, ICharacter, IRoom, ILevel, ITimer
+)
 from .game_objects import Timer
+from .generators import MazeGenerator, MazeLayout, UniformMazeGenerator
 
 
 class Point:
@@ -190,6 +193,8 @@ class Portal(Door):
     def __init__(self, timer: ITimer):
         super().__init__()
         self._timer = timer
+        self.armed_delegate: Optional[Callable[["Portal"], None]] = None
+        self.character_passed_delegate: Optional[Callable[["Portal"], None]] = None
 
     @property
     def timer(self) -> ITimer:
@@ -211,43 +216,27 @@ class Portal(Door):
         if not self._timer.is_active:
             self._timer.start()
 
+            if self.armed_delegate:
+                self.armed_delegate(self)
+
         if self._timer.is_times_up():
             super().move_character_to_another_room()
             self._timer.reset()
 
+            if self.character_passed_delegate:
+                self.character_passed_delegate(self)
 
-class BoundaryGenerator:
-    def __init__(self, size: int):
-        self._max_walls_percent = 20  # процент должен быть для каждого ряда и столбца отдельно
-        self._internal_boundaries_amount = self._calculate_internal_boundaries_amount(size)
-        self._internal_walls_amount = 0
-        self._boundaries: list[Boundary] = [Wall, Door, Portal]  # type: ignore
-
-    @staticmethod
-    def _calculate_internal_boundaries_amount(size: int) -> int:
-        return size * (size - 1) + size * (size - 1)
-
-    def _calculate_walls_percent(self):
-        return self._internal_walls_amount * 100 / self._internal_boundaries_amount
-
-    def get_boundary(self, position: BoundaryPosition) -> IBoundary:
-        boundary_type = random.choice(self._boundaries)
-
-        if boundary_type is Wall:
-            percent = self._calculate_walls_percent()
-            if percent > self._max_walls_percent:
-                return self.get_boundary(position)
-            else:
-                self._internal_walls_amount += 1
 
-        if boundary_type is Portal:
-            boundary = boundary_type(Timer(amount_of_time=2))  # type: ignore
-        else:
-            boundary = boundary_type()  # type: ignore
+def create_boundary(kind: BoundaryKind, position: BoundaryPosition) -> Boundary:
+    if kind is BoundaryKind.WALL:
+        boundary: Boundary = Wall()
+    elif kind is BoundaryKind.PORTAL:
+        boundary = Portal(Timer(amount_of_time=2))
+    else:
+        boundary = Door()
 
-        boundary.position = position
-
-        return boundary  # type: ignore
+    boundary.position = position
+    return boundary
 
 
 class PortalsKeeper:
@@ -276,12 +265,15 @@ class Level(ILevel):
         size: int,
         character_1: ICharacter,
         character_2: ICharacter,
-        portals_keeper: PortalsKeeper
+        portals_keeper: PortalsKeeper,
+        maze_generator: Optional[MazeGenerator] = None
     ):
         self._size = size
         self._character_1 = character_1
         self._character_2 = character_2
         self._portals_keeper = portals_keeper
+        self._maze_generator = maze_generator or UniformMazeGenerator()
+        self._layout = MazeLayout(size)
         self._rooms = self._generate()
         self._set_characters_into_room()
 
@@ -289,6 +281,10 @@ class Level(ILevel):
     def rooms(self) -> list[list[IRoom]]:
         return self._rooms
 
+    @property
+    def layout(self) -> MazeLayout:
+        return self._layout
+
     def get_character_from_room(self, room: IRoom) -> Optional[ICharacter]:
         if self._character_1.current_room is room:
             return self._character_1
@@ -341,16 +337,16 @@ class Level(ILevel):
                     boundary.room_1 = room
 
     def _arrange_internal_boundaries(self, rooms: list[list[IRoom]]) -> None:
-        bg = BoundaryGenerator(self._size)
-        self._arrange_vertical_boundaries(rooms, bg)
-        self._arrange_horizontal_boundaries(rooms, bg)
+        self._layout = self._maze_generator.generate(self._size)
+        self._arrange_vertical_boundaries(rooms, self._layout)
+        self._arrange_horizontal_boundaries(rooms, self._layout)
 
     def _arrange_vertical_boundaries(
         self,
         rooms: list[list[IRoom]],
-        b_generator: BoundaryGenerator
+        layout: MazeLayout
     ) -> None:
-        for row in rooms:
+        for y, row in enumerate(rooms):
 
             adjacent_rooms = [
                 (row[i], row[i + 1])
@@ -358,8 +354,11 @@ class Level(ILevel):
                 in range(len(row) - 1)
             ]
 
-            for rooms_pair in adjacent_rooms:
-                boundary = b_generator.get_boundary(BoundaryPosition.VERTICAL)
+            for x, rooms_pair in enumerate(adjacent_rooms):
+                boundary = create_boundary(
+                    layout.get_kind(layout.vertical_index(x, y)),
+                    BoundaryPosition.VERTICAL
+                )
 
                 if isinstance(boundary, Portal):
                     self._portals_keeper.add_portal(boundary)
@@ -373,7 +372,7 @@ class Level(ILevel):
     def _arrange_horizontal_boundaries(
         self,
         rooms: list[list[IRoom]],
-        b_generator: BoundaryGenerator
+        layout: MazeLayout
     ) -> None:
 
         adjacent_rows = [
@@ -382,9 +381,12 @@ class Level(ILevel):
             in range(len(rooms) - 1)
         ]
 
-        for rows_pair in adjacent_rows:
-            for rooms_pair in zip(*rows_pair):
-                boundary = b_generator.get_boundary(BoundaryPosition.HORIZONTAL)
+        for y, rows_pair in enumerate(adjacent_rows):
+            for x, rooms_pair in enumerate(zip(*rows_pair)):
+                boundary = create_boundary(
+                    layout.get_kind(layout.horizontal_index(x, y)),
+                    BoundaryPosition.HORIZONTAL
+                )
 
                 if isinstance(boundary, Portal):
                     self._portals_keeper.add_portal(boundary)
@@ -0,0 +1,145 @@
+"""Набор заранее сгенерированных уровней.
+
+Уровни генерируются и проверяются при сборке, а игра только читает готовую раскладку,
+поэтому запуск не тратит время на генерацию.
+
+Формат файла (все числа little-endian):
+- заголовок: сигнатура b"RRLP", версия (uint16), количество уровней (uint32);
+- оглавление: для каждого уровня смещение данных (uint64), размер и seed (uint32);
+- данные: раскладки уровней, по байту BoundaryKind на перегородку.
+
+При открытии читается только заголовок и оглавление, раскладка уровня читается
+с диска при первом обращении к нему.
+"""
+from typing import BinaryIO, Optional
+import struct
+
+from .generators import MazeGenerator, MazeLayout, UniformMazeGenerator
+
+
+_SIGNATURE = b"RRLP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_ENTRY = struct.Struct("<QII")
+
+
+class LevelPackError(Exception):
+    pass
+
+
+def validate_layout(layout: MazeLayout) -> bool:
+    """Уровень годится, если из любой комнаты можно попасть в любую другую."""
+    return layout.count_components() == 1
+
+
+def build_level_pack(
+    path: str,
+    size: int,
+    amount: int,
+    generator_type: type[MazeGenerator] = UniformMazeGenerator,
+    first_seed: int = 0
+) -> None:
+    """Сгенерировать amount проверенных уровней и записать их в файл.
+    Уровни, не прошедшие проверку, пропускаются, seed берётся следующий.
+    """
+    layouts: list[tuple[int, MazeLayout]] = []
+    seed = first_seed
+    while len(layouts) < amount:
+        layout = generator_type(seed=seed).generate(size)  # type: ignore
+        if validate_layout(layout):
+            layouts.append((seed, layout))
+        seed += 1
+
+    write_level_pack(path, layouts)
+
+
+def write_level_pack(path: str, layouts: list[tuple[int, MazeLayout]]) -> None:
+    offset = _HEADER.size + _ENTRY.size * len(layouts)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_SIGNATURE, _VERSION, len(layouts)))
+        for seed, layout in layouts:
+            file.write(_ENTRY.pack(offset, layout.size, seed))
+            offset += layout.boundaries_amount
+        for _, layout in layouts:
+            file.write(layout.kinds)
+
+
+class LevelPack:
+    def __init__(self, path: str):
+        self._path = path
+        self._file: Optional[BinaryIO] = None
+        self._entries: list[tuple[int, int, int]] = []
+        self._layouts: dict[int, MazeLayout] = {}
+        try:
+            self._read_contents()
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "LevelPack":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def get_size(self, index: int) -> int:
+        return self._entries[index][1]
+
+    def get_seed(self, index: int) -> int:
+        return self._entries[index][2]
+
+    def find_indexes(self, size: int) -> list[int]:
+        return [
+            index
+            for index, (_, level_size, _) in enumerate(self._entries)
+            if level_size == size
+        ]
+
+    def get_layout(self, index: int) -> MazeLayout:
+        layout = self._layouts.get(index)
+        if layout is not None:
+            return layout
+
+        offset, size, _ = self._entries[index]
+        length = 2 * size * (size - 1)
+        file = self._open()
+        file.seek(offset)
+        kinds = bytearray(file.read(length))
+        if len(kinds) != length:
+            raise LevelPackError(f"Уровень {index} в файле {self._path} обрезан.")
+
+        layout = MazeLayout(size, kinds)
+        self._layouts[index] = layout
+        return layout
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            self._file = open(self._path, "rb")
+        return self._file
+
+    def _read_contents(self) -> None:
+        file = self._open()
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise LevelPackError(f"Файл {self._path} не является набором уровней.")
+
+        signature, version, amount = _HEADER.unpack(header)
+        if signature != _SIGNATURE or version != _VERSION:
+            raise LevelPackError(f"Файл {self._path} не является набором уровней.")
+
+        contents = file.read(_ENTRY.size * amount)
+        if len(contents) != _ENTRY.size * amount:
+            raise LevelPackError(f"Оглавление файла {self._path} обрезано.")
+
+        self._entries = [
+            _ENTRY.unpack_from(contents, position * _ENTRY.size)
+            for position in range(amount)
+        ]
@@ -0,0 +1,384 @@
+"""Иерархический поиск пути (HPA*) по раскладке лабиринта.
+
+Поле делится на квадратные кластеры. На каждой границе двух кластеров непрерывный
+участок проходимых перегородок даёт один вход (середину участка). Участок прерывается
+не только стеной на самой границе, но и стеной между соседними комнатами вдоль
+границы, иначе вход мог бы оказаться недоступен из части участка. Для входов одного
+кластера заранее считаются стоимости путей между ними внутри кластера. Получается
+абстрактный граф, в котором на порядки меньше вершин, чем комнат.
+
+Поиск пути:
+1. Старт и финиш соединяются с входами своих кластеров локальным поиском.
+2. A* ищет путь по абстрактному графу.
+3. Каждый участок абстрактного пути уточняется локальным поиском внутри кластера.
+
+Стоимость прохода через дверь равна одному ходу, через портал - одному ходу плюс
+ожиданию таймера. Когда меняется перегородка, пересчитываются только кластеры,
+которые она разделяет, и границы, вдоль которых она идёт, вместе с кластерами по обе
+стороны этих границ.
+
+Комнаты обозначаются номерами y * size + x, как в MazeLayout.
+"""
+from typing import Iterator, Optional
+import heapq
+
+from .generators import MazeLayout
+from .interface import BoundaryKind
+
+
+class HierarchicalPathPlanner:
+    def __init__(self, layout: MazeLayout, cluster_size: int = 16, portal_delay: int = 2):
+        self._layout = layout
+        self._size = layout.size
+        self._cluster_size = cluster_size
+        self._clusters_in_row = (self._size + cluster_size - 1) // cluster_size
+        # Стоимость прохода по коду перегородки, стена непроходима.
+        self._costs = (0, 1, 1 + portal_delay)
+
+        clusters_amount = self._clusters_in_row * self._clusters_in_row
+        # Для каждого кластера: вход -> {другой вход этого кластера: стоимость}.
+        self._intra_edges: list[dict[int, dict[int, int]]] = [
+            {} for _ in range(clusters_amount)
+        ]
+        # Вход -> {вход соседнего кластера: стоимость}.
+        self._inter_edges: dict[int, dict[int, int]] = {}
+        # Границы кластеров (меньший номер, больший номер) -> индексы перегородок-входов.
+        self._borders: dict[tuple[int, int], list[int]] = {}
+
+        self._build()
+
+    @property
+    def clusters_amount(self) -> int:
+        return len(self._intra_edges)
+
+    def get_cluster(self, room: int) -> int:
+        y, x = divmod(room, self._size)
+        return (
+            (y // self._cluster_size) * self._clusters_in_row
+            + x // self._cluster_size
+        )
+
+    def get_entrances(self, cluster: int) -> set[int]:
+        return set(self._intra_edges[cluster])
+
+    def find_path(
+        self,
+        start: tuple[int, int],
+        goal: tuple[int, int]
+    ) -> Optional[list[tuple[int, int]]]:
+        """Вернуть список координат комнат от start до goal включительно
+        или None, если пути нет.
+        """
+        start_room = start[1] * self._size + start[0]
+        goal_room = goal[1] * self._size + goal[0]
+        if start_room == goal_room:
+            return [start]
+
+        abstract_path = self._find_abstract_path(start_room, goal_room)
+        if abstract_path is None:
+            return None
+
+        rooms = [start_room]
+        for room_1, room_2 in zip(abstract_path, abstract_path[1:]):
+            if self.get_cluster(room_1) == self.get_cluster(room_2):
+                segment = self._find_local_path(room_1, room_2)
+                assert segment is not None
+                rooms.extend(segment[1:])
+            else:
+                rooms.append(room_2)
+
+        return [(room % self._size, room // self._size) for room in rooms]
+
+    def update_boundary(self, index: int, kind: BoundaryKind) -> None:
+        """Заменить тип перегородки и пересчитать только затронутые кластеры."""
+        self._layout.kinds[index] = kind
+
+        room_1, room_2 = self._layout.get_rooms(index)
+        cluster_1 = self.get_cluster(room_1)
+        cluster_2 = self.get_cluster(room_2)
+
+        clusters = {cluster_1, cluster_2}
+        borders = self._get_linked_borders(index)
+        if cluster_1 != cluster_2:
+            borders.append((min(cluster_1, cluster_2), max(cluster_1, cluster_2)))
+
+        for key in borders:
+            self._build_border(*key)
+            clusters.update(key)
+        for cluster in sorted(clusters):
+            self._build_cluster(cluster)
+
+    def _build(self) -> None:
+        for cluster_y in range(self._clusters_in_row):
+            for cluster_x in range(self._clusters_in_row):
+                cluster = cluster_y * self._clusters_in_row + cluster_x
+                if cluster_x + 1 < self._clusters_in_row:
+                    self._build_border(cluster, cluster + 1)
+                if cluster_y + 1 < self._clusters_in_row:
+                    self._build_border(cluster, cluster + self._clusters_in_row)
+
+        for cluster in range(self.clusters_amount):
+            self._build_cluster(cluster)
+
+    def _build_border(self, cluster_1: int, cluster_2: int) -> None:
+        key = (min(cluster_1, cluster_2), max(cluster_1, cluster_2))
+
+        for index in self._borders.get(key, []):
+            room_1, room_2 = self._layout.get_rooms(index)
+            self._inter_edges.get(room_1, {}).pop(room_2, None)
+            self._inter_edges.get(room_2, {}).pop(room_1, None)
+
+        entrances: list[int] = []
+        run: list[int] = []
+        for index, link_1, link_2 in self._get_border_boundaries(*key):
+            if self._layout.kinds[index] != BoundaryKind.WALL:
+                run.append(index)
+            if run and (
+                self._layout.kinds[index] == BoundaryKind.WALL
+                or link_1 is None
+                or self._layout.kinds[link_1] == BoundaryKind.WALL
+                or link_2 is None
+                or self._layout.kinds[link_2] == BoundaryKind.WALL
+            ):
+                entrances.append(run[len(run) // 2])
+                run = []
+
+        self._borders[key] = entrances
+        for index in entrances:
+            room_1, room_2 = self._layout.get_rooms(index)
+            cost = self._costs[self._layout.kinds[index]]
+            self._inter_edges.setdefault(room_1, {})[room_2] = cost
+            self._inter_edges.setdefault(room_2, {})[room_1] = cost
+
+    def _get_border_boundaries(
+        self,
+        cluster_1: int,
+        cluster_2: int
+    ) -> Iterator[tuple[int, Optional[int], Optional[int]]]:
+        """Перегородки между соседними кластерами (cluster_1 < cluster_2) по порядку.
+        Вместе с каждой возвращаются перегородки, которые отделяют её комнаты
+        от комнат следующей перегородки с той и другой стороны границы.
+        """
+        cluster_y, cluster_x = divmod(cluster_1, self._clusters_in_row)
+        first_x = cluster_x * self._cluster_size
+        first_y = cluster_y * self._cluster_size
+        layout = self._layout
+
+        if cluster_2 == cluster_1 + 1:
+            x = first_x + self._cluster_size - 1
+            last_y = min(first_y + self._cluster_size, self._size) - 1
+            for y in range(first_y, last_y + 1):
+                if y == last_y:
+                    yield layout.vertical_index(x, y), None, None
+                else:
+                    yield (
+                        layout.vertical_index(x, y),
+                        layout.horizontal_index(x, y),
+                        layout.horizontal_index(x + 1, y),
+                    )
+        else:
+            y = first_y + self._cluster_size - 1
+            last_x = min(first_x + self._cluster_size, self._size) - 1
+            for x in range(first_x, last_x + 1):
+                if x == last_x:
+                    yield layout.horizontal_index(x, y), None, None
+                else:
+                    yield (
+                        layout.horizontal_index(x, y),
+                        layout.vertical_index(x, y),
+                        layout.vertical_index(x, y + 1),
+                    )
+
+    def _get_linked_borders(self, index: int) -> list[tuple[int, int]]:
+        """Границы кластеров, вдоль которых идёт перегородка внутри кластера.
+        От таких перегородок зависит, где границу делят на участки входов.
+        """
+        room_1, room_2 = self._layout.get_rooms(index)
+        cluster = self.get_cluster(room_1)
+        if cluster != self.get_cluster(room_2):
+            return []
+
+        y, x = divmod(room_1, self._size)
+        # Вертикальная перегородка идёт вдоль горизонтальных границ и наоборот.
+        if room_2 == room_1 + 1:
+            position, step = y, self._clusters_in_row
+        else:
+            position, step = x, 1
+
+        borders: list[tuple[int, int]] = []
+        if position > 0 and position % self._cluster_size == 0:
+            borders.append((cluster - step, cluster))
+        if (
+            position + 1 < self._size
+            and position % self._cluster_size == self._cluster_size - 1
+        ):
+            borders.append((cluster, cluster + step))
+        return borders
+
+    def _build_cluster(self, cluster: int) -> None:
+        entrances: set[int] = set()
+        for key in self._get_cluster_borders(cluster):
+            for index in self._borders.get(key, []):
+                for room in self._layout.get_rooms(index):
+                    if self.get_cluster(room) == cluster:
+                        entrances.add(room)
+
+        edges: dict[int, dict[int, int]] = {}
+        for entrance in entrances:
+            distances = self._dijkstra(entrance, cluster)
+            edges[entrance] = {
+                other: distances[other]
+                for other in entrances
+                if other != entrance and other in distances
+            }
+
+        self._intra_edges[cluster] = edges
+
+    def _get_cluster_borders(self, cluster: int) -> list[tuple[int, int]]:
+        cluster_y, cluster_x = divmod(cluster, self._clusters_in_row)
+        borders: list[tuple[int, int]] = []
+        if cluster_y > 0:
+            borders.append((cluster - self._clusters_in_row, cluster))
+        if cluster_x > 0:
+            borders.append((cluster - 1, cluster))
+        if cluster_x + 1 < self._clusters_in_row:
+            borders.append((cluster, cluster + 1))
+        if cluster_y + 1 < self._clusters_in_row:
+            borders.append((cluster, cluster + self._clusters_in_row))
+        return borders
+
+    def _find_abstract_path(self, start: int, goal: int) -> Optional[list[int]]:
+        start_cluster = self.get_cluster(start)
+        goal_cluster = self.get_cluster(goal)
+
+        start_distances = self._dijkstra(start, start_cluster)
+        start_edges = {
+            entrance: start_distances[entrance]
+            for entrance in self._intra_edges[start_cluster]
+            if entrance in start_distances
+        }
+        if goal in start_distances:
+            start_edges[goal] = start_distances[goal]
+
+        goal_distances = self._dijkstra(goal, goal_cluster)
+        goal_edges = {
+            entrance: goal_distances[entrance]
+            for entrance in self._intra_edges[goal_cluster]
+            if entrance in goal_distances
+        }
+
+        goal_y, goal_x = divmod(goal, self._size)
+        best = {start: 0}
+        parents: dict[int, int] = {}
+        queue = [(0, 0, start)]
+
+        while queue:
+            _, cost, room = heapq.heappop(queue)
+            if room == goal:
+                path = [goal]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+            if cost > best[room]:
+                continue
+
+            neighbours = list(self._intra_edges[self.get_cluster(room)].get(room, {}).items())
+            neighbours.extend(self._inter_edges.get(room, {}).items())
+            if room == start:
+                neighbours.extend(start_edges.items())
+            if room in goal_edges:
+                neighbours.append((goal, goal_edges[room]))
+
+            for neighbour, step in neighbours:
+                new_cost = cost + step
+                if new_cost >= best.get(neighbour, new_cost + 1):
+                    continue
+                best[neighbour] = new_cost
+                parents[neighbour] = room
+                y, x = divmod(neighbour, self._size)
+                heuristic = abs(goal_x - x) + abs(goal_y - y)
+                heapq.heappush(queue, (new_cost + heuristic, new_cost, neighbour))
+
+        return None
+
+    def _find_local_path(self, start: int, goal: int) -> Optional[list[int]]:
+        parents: dict[int, int] = {}
+        distances = self._dijkstra(start, self.get_cluster(start), goal, parents)
+        if goal not in distances:
+            return None
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def _dijkstra(
+        self,
+        start: int,
+        cluster: int,
+        goal: Optional[int] = None,
+        parents: Optional[dict[int, int]] = None
+    ) -> dict[int, int]:
+        """Кратчайшие стоимости от start до комнат, не выходя за пределы кластера."""
+        cluster_y, cluster_x = divmod(cluster, self._clusters_in_row)
+        min_x = cluster_x * self._cluster_size
+        min_y = cluster_y * self._cluster_size
+        max_x = min(min_x + self._cluster_size, self._size) - 1
+        max_y = min(min_y + self._cluster_size, self._size) - 1
+
+        distances = {start: 0}
+        queue = [(0, start)]
+
+        while queue:
+            cost, room = heapq.heappop(queue)
+            if room == goal:
+                break
+            if cost > distances[room]:
+                continue
+
+            for neighbour, step in self._get_neighbours(room, min_x, min_y, max_x, max_y):
+                new_cost = cost + step
+                if new_cost >= distances.get(neighbour, new_cost + 1):
+                    continue
+                distances[neighbour] = new_cost
+                if parents is not None:
+                    parents[neighbour] = room
+                heapq.heappush(queue, (new_cost, neighbour))
+
+        return distances
+
+    def _get_neighbours(
+        self,
+        room: int,
+        min_x: int,
+        min_y: int,
+        max_x: int,
+        max_y: int
+    ) -> list[tuple[int, int]]:
+        """Соседние комнаты в заданных границах, в которые можно пройти, и стоимость шага."""
+        layout = self._layout
+        kinds = layout.kinds
+        costs = self._costs
+        size = self._size
+        y, x = divmod(room, size)
+
+        neighbours: list[tuple[int, int]] = []
+        if y > min_y:
+            kind = kinds[layout.horizontal_index(x, y - 1)]
+            if kind != BoundaryKind.WALL:
+                neighbours.append((room - size, costs[kind]))
+        if x < max_x:
+            kind = kinds[layout.vertical_index(x, y)]
+            if kind != BoundaryKind.WALL:
+                neighbours.append((room + 1, costs[kind]))
+        if y < max_y:
+            kind = kinds[layout.horizontal_index(x, y)]
+            if kind != BoundaryKind.WALL:
+                neighbours.append((room + size, costs[kind]))
+        if x > min_x:
+            kind = kinds[layout.vertical_index(x - 1, y)]
+            if kind != BoundaryKind.WALL:
+                neighbours.append((room - 1, costs[kind]))
+        return neighbours
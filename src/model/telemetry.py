@@ -0,0 +1,115 @@
+"""Телеметрия использования уровня: тепловые карты посещений комнат,
+проходов через перегородки и срабатываний порталов.
+
+Телеметрия подписывается на EventBus через on_events и получает перемещения персонажей
+и срабатывания порталов пакетом в конце хода. Счётчики хранятся в заранее выделенных
+массивах (array), индексы комнат и перегородок те же, что в MazeLayout, поэтому обработка
+события - это увеличение элемента массива.
+
+Счётчики можно сохранить в байты, передать из рабочего процесса и сложить
+с другими через merge.
+"""
+from array import array
+from typing import Optional
+
+from .events import CharacterMovedEvent, Event, PortalFiredEvent
+from .generators import MazeLayout
+from .interface import BoundaryPosition, IRoom
+from .level import Portal
+
+
+class HeatmapTelemetry:
+    _COUNTER_TYPE = "Q"
+
+    def __init__(self, layout: MazeLayout):
+        self._layout = layout
+        self._size = layout.size
+        self.room_visits = self._create_counters(self._size * self._size)
+        self.boundary_passes = self._create_counters(layout.boundaries_amount)
+        self.portal_uses = self._create_counters(layout.boundaries_amount)
+
+    def on_events(self, events: list[Event]) -> None:
+        for event in events:
+            if isinstance(event, CharacterMovedEvent):
+                self._count_room_change(event.previous_room, event.room)
+            elif isinstance(event, PortalFiredEvent):
+                self._count_portal_use(event.portal)
+
+    def _count_room_change(self, previous_room: Optional[IRoom], room: IRoom) -> None:
+        x = room.get_x_coordinate()
+        y = room.get_y_coordinate()
+        self.room_visits[y * self._size + x] += 1
+
+        if previous_room is None:
+            return
+
+        previous_x = previous_room.get_x_coordinate()
+        previous_y = previous_room.get_y_coordinate()
+        if previous_y == y and abs(previous_x - x) == 1:
+            self.boundary_passes[self._layout.vertical_index(min(x, previous_x), y)] += 1
+        elif previous_x == x and abs(previous_y - y) == 1:
+            self.boundary_passes[self._layout.horizontal_index(x, min(y, previous_y))] += 1
+
+    def _count_portal_use(self, portal: Portal) -> None:
+        room = portal.room_1
+        if room is None:
+            return
+
+        x = room.get_x_coordinate()
+        y = room.get_y_coordinate()
+        if portal.position is BoundaryPosition.VERTICAL:
+            self.portal_uses[self._layout.vertical_index(x, y)] += 1
+        else:
+            self.portal_uses[self._layout.horizontal_index(x, y)] += 1
+
+    def merge(self, other: "HeatmapTelemetry") -> None:
+        if other._size != self._size:
+            raise ValueError("Нельзя объединить телеметрию уровней разного размера.")
+
+        for counters, other_counters in (
+            (self.room_visits, other.room_visits),
+            (self.boundary_passes, other.boundary_passes),
+            (self.portal_uses, other.portal_uses),
+        ):
+            for index, value in enumerate(other_counters):
+                if value:
+                    counters[index] += value
+
+    def to_bytes(self) -> bytes:
+        return (
+            self.room_visits.tobytes()
+            + self.boundary_passes.tobytes()
+            + self.portal_uses.tobytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, layout: MazeLayout, data: bytes) -> "HeatmapTelemetry":
+        telemetry = cls(layout)
+        offset = 0
+        for counters in (
+            telemetry.room_visits,
+            telemetry.boundary_passes,
+            telemetry.portal_uses,
+        ):
+            length = len(counters) * counters.itemsize
+            counters[:] = array(cls._COUNTER_TYPE, data[offset:offset + length])
+            offset += length
+        return telemetry
+
+    def get_rooms_heatmap(self) -> list[list[int]]:
+        return [
+            list(self.room_visits[y * self._size:(y + 1) * self._size])
+            for y in range(self._size)
+        ]
+
+    def save_rooms_heatmap_image(self, path: str) -> None:
+        """Сохранить тепловую карту посещений комнат в оттенках серого (формат PGM)."""
+        maximum = max(self.room_visits, default=0) or 1
+        pixels = bytes(value * 255 // maximum for value in self.room_visits)
+        with open(path, "wb") as file:
+            file.write(f"P5\n{self._size} {self._size}\n255\n".encode("ascii"))
+            file.write(pixels)
+
+    @classmethod
+    def _create_counters(cls, amount: int) -> "array[int]":
+        return array(cls._COUNTER_TYPE, bytes(amount * array(cls._COUNTER_TYPE).itemsize))
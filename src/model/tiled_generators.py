@@ -0,0 +1,220 @@
+"""Параллельная генерация больших уровней по плиткам.
+
+Поле делится на квадратные плитки. Каждая плитка генерируется отдельным процессом
+алгоритмом Краскала и записывает типы своих внутренних перегородок прямо в общий
+массив в разделяемой памяти. После этого основной процесс сшивает плитки:
+строит остовное дерево из плиток, открывая по одному проходу на шве между
+соседними плитками этого дерева, и расставляет оставшиеся стены и проходы на швах.
+
+Генератор случайных чисел каждой плитки зависит только от seed и номера плитки,
+поэтому при одинаковом seed результат побайтно совпадает при любом количестве
+процессов.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+import random
+
+from .generators import KruskalMazeGenerator, MazeLayout
+from .interface import BoundaryKind
+
+
+class TileTask:
+    """Описание плитки, передаваемое в рабочий процесс."""
+    def __init__(
+        self,
+        memory_name: str,
+        size: int,
+        number: int,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        seed: int,
+        walls_percent: int,
+        portals_percent: int
+    ):
+        self.memory_name = memory_name
+        self.size = size
+        self.number = number
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.walls_percent = walls_percent
+        self.portals_percent = portals_percent
+
+
+def generate_tile(task: TileTask) -> int:
+    """Сгенерировать внутренние перегородки плитки. Возвращает количество стен."""
+    memory = shared_memory.SharedMemory(name=task.memory_name)
+    try:
+        assert memory.buf is not None
+        layout = MazeLayout(task.size, memory.buf)
+        generator = _TileGenerator(
+            task.walls_percent,
+            task.portals_percent,
+            _get_tile_seed(task.seed, task.number)
+        )
+        return generator.generate_tile(layout, task.x, task.y, task.width, task.height)
+    finally:
+        memory.close()
+
+
+def _get_tile_seed(seed: int, number: int) -> int:
+    return seed * 1_000_003 + number
+
+
+class _TileGenerator(KruskalMazeGenerator):
+    def generate_tile(
+        self,
+        layout: MazeLayout,
+        x: int,
+        y: int,
+        width: int,
+        height: int
+    ) -> int:
+        boundaries: list[tuple[int, int, int]] = []
+        for local_y in range(height):
+            for local_x in range(width):
+                room = local_y * width + local_x
+                if local_x < width - 1:
+                    index = layout.vertical_index(x + local_x, y + local_y)
+                    boundaries.append((index, room, room + 1))
+                if local_y < height - 1:
+                    index = layout.horizontal_index(x + local_x, y + local_y)
+                    boundaries.append((index, room, room + width))
+
+        self._random.shuffle(boundaries)
+        parents = list(range(width * height))
+        candidates: list[int] = []
+        for index, room_1, room_2 in boundaries:
+            root_1 = self._find(parents, room_1)
+            root_2 = self._find(parents, room_2)
+            if root_1 != root_2:
+                parents[root_1] = root_2
+                layout.kinds[index] = self._choose_passage_kind()
+            else:
+                candidates.append(index)
+
+        walls_amount = min(len(boundaries) * self._walls_percent // 100, len(candidates))
+        for position, index in enumerate(candidates):
+            if position < walls_amount:
+                layout.kinds[index] = BoundaryKind.WALL
+            else:
+                layout.kinds[index] = self._choose_passage_kind()
+
+        return walls_amount
+
+
+class TiledMazeGenerator(KruskalMazeGenerator):
+    # Seed передаётся в рабочие процессы, поэтому он выбирается сразу и всегда задан.
+    _seed: int
+
+    def __init__(
+        self,
+        tile_size: int = 256,
+        workers: Optional[int] = None,
+        walls_percent: int = 20,
+        portals_percent: int = 40,
+        seed: Optional[int] = None
+    ):
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        super().__init__(walls_percent, portals_percent, seed)
+        self._tile_size = tile_size
+        self._workers = workers
+
+    def generate(self, size: int) -> MazeLayout:
+        self._random = random.Random(self._seed)
+        boundaries_amount = 2 * size * (size - 1)
+        if boundaries_amount == 0:
+            return MazeLayout(size)
+
+        memory = shared_memory.SharedMemory(create=True, size=boundaries_amount)
+        try:
+            tasks = self._create_tasks(memory.name, size)
+            if self._workers == 1:
+                walls_amount = sum(generate_tile(task) for task in tasks)
+            else:
+                with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                    walls_amount = sum(executor.map(generate_tile, tasks))
+
+            assert memory.buf is not None
+            layout = MazeLayout(size, bytearray(memory.buf[:boundaries_amount]))
+        finally:
+            memory.close()
+            memory.unlink()
+
+        self._stitch(layout, walls_amount)
+        return layout
+
+    def _create_tasks(self, memory_name: str, size: int) -> list[TileTask]:
+        tasks: list[TileTask] = []
+        for y in range(0, size, self._tile_size):
+            for x in range(0, size, self._tile_size):
+                tasks.append(TileTask(
+                    memory_name,
+                    size,
+                    len(tasks),
+                    x,
+                    y,
+                    min(self._tile_size, size - x),
+                    min(self._tile_size, size - y),
+                    self._seed,
+                    self._walls_percent,
+                    self._portals_percent
+                ))
+        return tasks
+
+    def _stitch(self, layout: MazeLayout, walls_amount: int) -> None:
+        """Расставить перегородки на швах между плитками."""
+        size = layout.size
+        tiles_in_row = (size + self._tile_size - 1) // self._tile_size
+
+        # Швы между соседними плитками: (плитка, соседняя плитка, перегородки шва).
+        seams: list[tuple[int, int, list[int]]] = []
+        for tile_y in range(tiles_in_row):
+            for tile_x in range(tiles_in_row):
+                tile = tile_y * tiles_in_row + tile_x
+                first_x = tile_x * self._tile_size
+                first_y = tile_y * self._tile_size
+                last_x = min(first_x + self._tile_size, size) - 1
+                last_y = min(first_y + self._tile_size, size) - 1
+                if last_x < size - 1:
+                    seams.append((tile, tile + 1, [
+                        layout.vertical_index(last_x, y)
+                        for y in range(first_y, last_y + 1)
+                    ]))
+                if last_y < size - 1:
+                    seams.append((tile, tile + tiles_in_row, [
+                        layout.horizontal_index(x, last_y)
+                        for x in range(first_x, last_x + 1)
+                    ]))
+
+        self._random.shuffle(seams)
+        parents = list(range(tiles_in_row * tiles_in_row))
+        tree: set[int] = set()
+        for tile_1, tile_2, indexes in seams:
+            root_1 = self._find(parents, tile_1)
+            root_2 = self._find(parents, tile_2)
+            if root_1 != root_2:
+                parents[root_1] = root_2
+                tree.add(self._random.choice(indexes))
+
+        candidates = [
+            index
+            for _, _, indexes in seams
+            for index in indexes
+            if index not in tree
+        ]
+        walls_left = self._calculate_walls_amount(layout) - walls_amount
+        walls = set(self._random.sample(candidates, max(0, min(walls_left, len(candidates)))))
+
+        for _, _, indexes in seams:
+            for index in indexes:
+                if index in walls:
+                    layout.kinds[index] = BoundaryKind.WALL
+                else:
+                    layout.kinds[index] = self._choose_passage_kind()
@@ -0,0 +1,157 @@
+"""Туман войны.
+
+Персонаж видит комнаты по прямой линии вверх, вниз, влево и вправо от своей комнаты,
+пока между комнатами стоят двери. Стена закрывает обзор. Через портал можно мельком
+увидеть только одну соседнюю комнату, дальше портала взгляд не проходит.
+
+Горизонтальный и вертикальный отрезки обзора одинаковы для всех комнат, которые в них
+входят, поэтому отрезок вычисляется один раз и запоминается для каждой своей комнаты.
+Когда персонаж переходит в соседнюю комнату через дверь, один из двух отрезков остаётся
+прежним и повторно не вычисляется.
+"""
+from typing import Optional
+
+from .interface import IBoundary, ICharacter, IRoom
+from .level import Door, Portal
+
+
+class SightSpan:
+    """Отрезок комнат, которые видят друг друга по прямой через двери."""
+    def __init__(self, rooms: list[IRoom], glimpses: list[IRoom]):
+        self.rooms = rooms
+        self.glimpses = glimpses
+
+    def visible_rooms(self) -> set[IRoom]:
+        return set(self.rooms) | set(self.glimpses)
+
+
+class SightSpansCache:
+    """Хранит вычисленные отрезки обзора уровня.
+    Один экземпляр можно использовать для всех персонажей одного уровня.
+    """
+    def __init__(self):
+        self._horizontal: dict[IRoom, SightSpan] = {}
+        self._vertical: dict[IRoom, SightSpan] = {}
+
+    def get_horizontal_span(self, room: IRoom) -> SightSpan:
+        span = self._horizontal.get(room)
+        if span is None:
+            span = self._build_span(room, "boundary_left", "boundary_right")
+            for span_room in span.rooms:
+                self._horizontal[span_room] = span
+        return span
+
+    def get_vertical_span(self, room: IRoom) -> SightSpan:
+        span = self._vertical.get(room)
+        if span is None:
+            span = self._build_span(room, "boundary_up", "boundary_down")
+            for span_room in span.rooms:
+                self._vertical[span_room] = span
+        return span
+
+    def _build_span(self, room: IRoom, backward: str, forward: str) -> SightSpan:
+        backward_rooms, backward_glimpse = self._look(room, backward)
+        forward_rooms, forward_glimpse = self._look(room, forward)
+
+        backward_rooms.reverse()
+        rooms = backward_rooms + [room] + forward_rooms
+        glimpses = [
+            glimpse
+            for glimpse in (backward_glimpse, forward_glimpse)
+            if glimpse is not None
+        ]
+        return SightSpan(rooms, glimpses)
+
+    def _look(self, room: IRoom, direction: str) -> tuple[list[IRoom], Optional[IRoom]]:
+        rooms: list[IRoom] = []
+        current = room
+
+        while True:
+            boundary: IBoundary | None = getattr(current, direction)
+            if not isinstance(boundary, Door):
+                return rooms, None
+
+            next_room = self._get_another_room(boundary, current)
+            if next_room is None:
+                return rooms, None
+
+            if isinstance(boundary, Portal):
+                return rooms, next_room
+
+            rooms.append(next_room)
+            current = next_room
+
+    @staticmethod
+    def _get_another_room(boundary: IBoundary, room: IRoom) -> Optional[IRoom]:
+        if boundary.room_1 is room:
+            return boundary.room_2
+        return boundary.room_1
+
+
+class CharacterVisibility:
+    """Множество комнат, которые видит персонаж.
+    Пересчитывается только после того как персонаж сменил комнату.
+    """
+    def __init__(self, character: ICharacter, spans_cache: SightSpansCache):
+        self._character = character
+        self._spans_cache = spans_cache
+        self._room: Optional[IRoom] = None
+        self._horizontal_span: Optional[SightSpan] = None
+        self._vertical_span: Optional[SightSpan] = None
+        self._visible_rooms: set[IRoom] = set()
+
+    @property
+    def visible_rooms(self) -> set[IRoom]:
+        self.update()
+        return self._visible_rooms
+
+    def is_visible(self, room: IRoom) -> bool:
+        return room in self.visible_rooms
+
+    def update(self) -> None:
+        room = self._character.current_room
+        if room is self._room:
+            return
+
+        self._room = room
+        if room is None:
+            self._horizontal_span = None
+            self._vertical_span = None
+            self._visible_rooms = set()
+            return
+
+        horizontal_span = self._spans_cache.get_horizontal_span(room)
+        vertical_span = self._spans_cache.get_vertical_span(room)
+
+        if (
+            horizontal_span is self._horizontal_span
+            and self._vertical_span is not None
+        ):
+            # Переход вдоль горизонтального отрезка: меняется только вертикальный.
+            self._visible_rooms = (
+                (self._visible_rooms - self._vertical_only_rooms())
+                | vertical_span.visible_rooms()
+            )
+        elif (
+            vertical_span is self._vertical_span
+            and self._horizontal_span is not None
+        ):
+            self._visible_rooms = (
+                (self._visible_rooms - self._horizontal_only_rooms())
+                | horizontal_span.visible_rooms()
+            )
+        else:
+            self._visible_rooms = (
+                horizontal_span.visible_rooms() | vertical_span.visible_rooms()
+            )
+
+        self._horizontal_span = horizontal_span
+        self._vertical_span = vertical_span
+
+    def _vertical_only_rooms(self) -> set[IRoom]:
+        assert self._horizontal_span is not None and self._vertical_span is not None
+        return self._vertical_span.visible_rooms() - self._horizontal_span.visible_rooms()
+
+    def _horizontal_only_rooms(self) -> set[IRoom]:
+        assert self._horizontal_span is not None and self._vertical_span is not None
+        return self._horizontal_span.visible_rooms() - self._vertical_span.visible_rooms()
@@ -0,0 +1,287 @@
+"""Хранилище результатов матчей.
+
+Результаты дописываются в конец файла блоками. Внутри блока данные лежат по столбцам:
+сначала все seed, потом все размеры и так далее. Поэтому для запроса вроде
+"доля побед по размеру уровня" читаются только нужные столбцы, по одному блоку
+за раз, и весь файл в память не загружается.
+
+Формат блока: сигнатура b"RRCB" и количество записей (uint32), затем столбцы в порядке
+COLUMNS, числа little-endian.
+
+Блок записывается одним вызовом write под блокировкой файла, поэтому в один файл
+могут писать несколько процессов. Если процесс завершился, не дописав блок, следующий
+писатель под той же блокировкой обрезает файл до конца последнего целого блока и только
+потом дописывает свой. Поэтому недописанный блок может быть только в конце файла,
+и при чтении он пропускается.
+"""
+from array import array
+from typing import BinaryIO, Iterator, Optional
+import os
+import struct
+import sys
+
+from src.model.events import Event, GameOverEvent, PortalFiredEvent
+from src.model.game_objects import GameRules
+from src.model.interface import BoundaryKind, ICharacter, ITimer
+from src.model.level import Level
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+# Название столбца и код типа array.
+COLUMNS = (
+    ("seed", "q"),
+    ("size", "H"),
+    ("walls_percent", "B"),
+    ("winner", "B"),
+    ("ticks", "I"),
+    ("encounter_room", "i"),
+    ("portal_uses", "I"),
+)
+NO_WINNER = 0
+NO_ENCOUNTER = -1
+
+_BLOCK_SIGNATURE = b"RRCB"
+_BLOCK_HEADER = struct.Struct("<4sI")
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+_ROW_SIZE = sum(array(type_code).itemsize for _, type_code in COLUMNS)
+
+
+class MatchRecord:
+    def __init__(
+        self,
+        seed: int,
+        size: int,
+        walls_percent: int,
+        winner: int,
+        ticks: int,
+        encounter_room: int = NO_ENCOUNTER,
+        portal_uses: int = 0
+    ):
+        self.seed = seed
+        self.size = size
+        self.walls_percent = walls_percent
+        # Номер победившего персонажа (1 или 2) или NO_WINNER.
+        self.winner = winner
+        self.ticks = ticks
+        # Номер комнаты встречи (y * size + x) или NO_ENCOUNTER.
+        self.encounter_room = encounter_room
+        self.portal_uses = portal_uses
+
+
+def _lock(file: BinaryIO) -> None:
+    if os.name == "nt":
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)  # type: ignore
+
+
+def _unlock(file: BinaryIO) -> None:
+    if os.name == "nt":
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)  # type: ignore
+
+
+def _iterate_blocks(file: BinaryIO, path: str, offset: int = 0) -> Iterator[tuple[int, int]]:
+    """Количество записей и смещение столбцов каждого целого блока, начиная с offset."""
+    file_size = os.fstat(file.fileno()).st_size
+
+    while offset + _BLOCK_HEADER.size <= file_size:
+        file.seek(offset)
+        signature, rows = _BLOCK_HEADER.unpack(file.read(_BLOCK_HEADER.size))
+        if signature != _BLOCK_SIGNATURE:
+            raise ValueError(f"Файл {path} повреждён, смещение {offset}.")
+
+        block_end = offset + _BLOCK_HEADER.size + rows * _ROW_SIZE
+        if block_end > file_size:
+            return
+
+        yield rows, offset + _BLOCK_HEADER.size
+        offset = block_end
+
+
+class ResultsWriter:
+    def __init__(self, path: str, batch_size: int = 1024):
+        self._path = path
+        self._batch_size = batch_size
+        self._columns = self._create_columns()
+        # Конец последнего проверенного целого блока в файле.
+        self._checked_size = 0
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def append(self, record: MatchRecord) -> None:
+        for name, _ in COLUMNS:
+            self._columns[name].append(getattr(record, name))
+
+        if len(self._columns["seed"]) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows = len(self._columns["seed"])
+        if rows == 0:
+            return
+
+        parts = [_BLOCK_HEADER.pack(_BLOCK_SIGNATURE, rows)]
+        for name, _ in COLUMNS:
+            column = self._columns[name]
+            if _NEEDS_BYTESWAP:
+                column.byteswap()
+            parts.append(column.tobytes())
+        block = b"".join(parts)
+
+        # Файл открыт и на чтение, чтобы под той же блокировкой проверить блоки.
+        with open(self._path, "a+b") as file:
+            _lock(file)
+            try:
+                self._truncate_unfinished_block(file)
+                file.write(block)
+                file.flush()
+                self._checked_size += len(block)
+            finally:
+                _unlock(file)
+
+        self._columns = self._create_columns()
+
+    def close(self) -> None:
+        self.flush()
+
+    def _truncate_unfinished_block(self, file: BinaryIO) -> None:
+        """Обрезать блок, который не дописал другой процесс. Вызывается под блокировкой."""
+        file_size = os.fstat(file.fileno()).st_size
+        if file_size < self._checked_size:
+            self._checked_size = 0
+
+        for rows, offset in _iterate_blocks(file, self._path, self._checked_size):
+            self._checked_size = offset + rows * _ROW_SIZE
+
+        if file_size > self._checked_size:
+            file.truncate(self._checked_size)
+
+    @staticmethod
+    def _create_columns() -> dict[str, "array[int]"]:
+        return {name: array(type_code) for name, type_code in COLUMNS}
+
+
+class ResultsReader:
+    def __init__(self, path: str):
+        self._path = path
+        self._types = dict(COLUMNS)
+        self._item_sizes = {
+            name: array(type_code).itemsize
+            for name, type_code in COLUMNS
+        }
+
+    def __len__(self) -> int:
+        with open(self._path, "rb") as file:
+            return sum(rows for rows, _ in _iterate_blocks(file, self._path))
+
+    def iterate_columns(self, names: tuple[str, ...]) -> Iterator[dict[str, "array[int]"]]:
+        """Читать файл по блокам, из каждого блока только указанные столбцы."""
+        for name in names:
+            if name not in self._types:
+                raise KeyError(f"Нет столбца {name}.")
+
+        with open(self._path, "rb") as file:
+            for rows, offset in _iterate_blocks(file, self._path):
+                columns: dict[str, "array[int]"] = {}
+                column_offset = offset
+                for name, type_code in COLUMNS:
+                    if name in names:
+                        file.seek(column_offset)
+                        column = array(type_code)
+                        column.frombytes(file.read(rows * self._item_sizes[name]))
+                        if _NEEDS_BYTESWAP:
+                            column.byteswap()
+                        columns[name] = column
+                    column_offset += rows * self._item_sizes[name]
+                yield columns
+
+    def count_by(self, group_by: tuple[str, ...]) -> dict[tuple[int, ...], int]:
+        counts: dict[tuple[int, ...], int] = {}
+        for columns in self.iterate_columns(group_by):
+            for key in zip(*(columns[name] for name in group_by)):
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def win_rate_by(self, group_by: tuple[str, ...], winner: int) -> dict[tuple[int, ...], float]:
+        """Доля матчей, которые выиграл персонаж winner, по группам."""
+        totals: dict[tuple[int, ...], int] = {}
+        wins: dict[tuple[int, ...], int] = {}
+        for columns in self.iterate_columns(group_by + ("winner",)):
+            keys = zip(*(columns[name] for name in group_by))
+            for key, match_winner in zip(keys, columns["winner"]):
+                totals[key] = totals.get(key, 0) + 1
+                if match_winner == winner:
+                    wins[key] = wins.get(key, 0) + 1
+
+        return {key: wins.get(key, 0) / total for key, total in totals.items()}
+
+
+class MatchRecorder:
+    """Записывает результат матча, когда игра заканчивается.
+    Подписывается на EventBus: считает срабатывания порталов и ждёт GameOverEvent.
+    """
+    def __init__(
+        self,
+        writer: ResultsWriter,
+        level: Level,
+        seed: Optional[int],
+        game_rules: GameRules,
+        game_timer: ITimer,
+        character_1: ICharacter
+    ):
+        self._writer = writer
+        self._level = level
+        self._seed = seed if seed is not None else 0
+        self._game_rules = game_rules
+        self._game_timer = game_timer
+        self._character_1 = character_1
+        self._portal_uses = 0
+
+    def on_events(self, events: list[Event]) -> None:
+        for event in events:
+            if isinstance(event, PortalFiredEvent):
+                self._portal_uses += 1
+            elif isinstance(event, GameOverEvent):
+                self._writer.append(self._create_record(event.surrendered_character))
+
+    def _create_record(self, surrendered_character: Optional[ICharacter]) -> MatchRecord:
+        layout = self._level.layout
+        size = layout.size
+        walls_percent = 0
+        if layout.boundaries_amount:
+            walls_percent = layout.count(BoundaryKind.WALL) * 100 // layout.boundaries_amount
+
+        winner = NO_WINNER
+        encounter_room = NO_ENCOUNTER
+        room = self._character_1.current_room
+        # Сдача - победа другого персонажа, встреча - победа второго,
+        # конец времени - победа первого.
+        if surrendered_character is not None:
+            winner = 2 if surrendered_character is self._character_1 else 1
+        elif self._game_rules.check_characters_encounter() and room is not None:
+            winner = 2
+            encounter_room = room.get_y_coordinate() * size + room.get_x_coordinate()
+        elif self._game_timer.is_times_up():
+            winner = 1
+
+        return MatchRecord(
+            self._seed,
+            size,
+            walls_percent,
+            winner,
+            self._game_timer.current_time,
+            encounter_room,
+            self._portal_uses
+        )
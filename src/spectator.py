@@ -0,0 +1,333 @@
+"""Трансляция игры для зрителей.
+
+Зритель сначала получает ключевой кадр: неизменный лабиринт и полное состояние игры.
+Дальше на каждый ход приходит только разница: кто из персонажей сменил комнату,
+у каких порталов изменился таймер и текущее время игры.
+
+Сообщения кодируются в JSON-строки (по одной строке на сообщение). Каждое сообщение
+кодируется один раз и одна и та же строка кладётся в очереди всех зрителей, поэтому
+количество зрителей почти не влияет на скорость игрового цикла.
+
+Трансляция подписывается на EventBus через on_events и при поиске разницы проверяет
+только персонажей и порталы, о которых пришли события.
+
+Если зритель не успевает читать и его очередь переполнилась, очередь очищается
+и зритель получает новый ключевой кадр. Если это повторяется слишком часто,
+зритель отключается.
+
+SpectatorServer отдаёт сообщения локальным зрителям по TCP, по одной JSON-строке
+на сообщение. Сокеты неблокирующие, поэтому медленный зритель не задерживает игру.
+"""
+from collections import deque
+from typing import Optional
+import json
+import socket
+
+from src.model.events import CharacterMovedEvent, Event, PortalArmedEvent, PortalFiredEvent
+from src.model.interface import BoundaryPosition, IBoundary, ICharacter, ILevel, ITimer
+from src.model.level import Door, Portal, PortalsKeeper, Wall
+
+
+class SpectatorSubscriber:
+    """Очередь сообщений одного зрителя."""
+    def __init__(self, max_pending: int, max_resyncs: int):
+        self._messages: deque[str] = deque()
+        self._max_pending = max_pending
+        self._max_resyncs = max_resyncs
+        self._resyncs = 0
+        self.needs_keyframe = True
+        self.is_dropped = False
+
+    @property
+    def resyncs(self) -> int:
+        return self._resyncs
+
+    def read(self) -> list[str]:
+        """Забрать все накопившиеся сообщения."""
+        messages: list[str] = []
+        while self._messages:
+            messages.append(self._messages.popleft())
+        return messages
+
+    def push(self, message: str) -> None:
+        if len(self._messages) >= self._max_pending:
+            self._messages.clear()
+            self._resyncs += 1
+            self.needs_keyframe = True
+            if self._resyncs > self._max_resyncs:
+                self.is_dropped = True
+            return
+
+        self._messages.append(message)
+
+
+class SpectatorBroadcaster:
+    def __init__(
+        self,
+        level: ILevel,
+        portals_keeper: PortalsKeeper,
+        game_timer: ITimer,
+        characters: list[ICharacter],
+        max_pending: int = 64,
+        max_resyncs: int = 3
+    ):
+        self._level = level
+        self._portals_keeper = portals_keeper
+        self._game_timer = game_timer
+        self._characters = characters
+        self._max_pending = max_pending
+        self._max_resyncs = max_resyncs
+
+        self._subscribers: list[SpectatorSubscriber] = []
+        self._tick = 0
+        self._maze: Optional[dict[str, object]] = None
+        self._characters_state: list[Optional[tuple[int, int]]] = []
+        self._portals_state: list[int] = []
+        self._remember_state()
+
+        self._characters_indexes = {
+            character: index
+            for index, character in enumerate(characters)
+        }
+        self._portals_indexes = {
+            portal: index
+            for index, portal in enumerate(portals_keeper.portals)
+        }
+        self._moved_characters: set[int] = set()
+        self._watched_portals: set[int] = set()
+
+    @property
+    def subscribers(self) -> list[SpectatorSubscriber]:
+        return self._subscribers
+
+    def subscribe(self) -> SpectatorSubscriber:
+        subscriber = SpectatorSubscriber(self._max_pending, self._max_resyncs)
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: SpectatorSubscriber) -> None:
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def on_events(self, events: list[Event]) -> None:
+        """Разослать изменения за ход по пакету событий модели."""
+        for event in events:
+            if isinstance(event, CharacterMovedEvent):
+                index = self._characters_indexes.get(event.character)
+                if index is not None:
+                    self._moved_characters.add(index)
+            elif isinstance(event, (PortalArmedEvent, PortalFiredEvent)):
+                index = self._portals_indexes.get(event.portal)
+                if index is not None:
+                    self._watched_portals.add(index)
+
+        self._tick += 1
+        self._send(self._build_delta())
+
+    def _send(self, message: dict[str, object]) -> None:
+        if not self._subscribers:
+            return
+
+        delta = self._encode(message)
+        keyframe: Optional[str] = None
+
+        for subscriber in self._subscribers:
+            if subscriber.needs_keyframe:
+                continue
+            subscriber.push(delta)
+
+        for subscriber in self._subscribers:
+            if not subscriber.needs_keyframe or subscriber.is_dropped:
+                continue
+            if keyframe is None:
+                keyframe = self._encode(self._build_keyframe())
+            subscriber.push(keyframe)
+            subscriber.needs_keyframe = False
+
+        self._subscribers = [
+            subscriber
+            for subscriber in self._subscribers
+            if not subscriber.is_dropped
+        ]
+
+    def _build_keyframe(self) -> dict[str, object]:
+        if self._maze is None:
+            self._maze = self._build_maze()
+
+        return {
+            "t": "k",
+            "tick": self._tick,
+            "clock": self._game_timer.current_time,
+            "end": self._game_timer.end_time,
+            "maze": self._maze,
+            "chars": self._characters_state,
+            "portals": self._portals_state,
+        }
+
+    def _build_delta(self) -> dict[str, object]:
+        characters: dict[int, Optional[tuple[int, int]]] = {}
+        for index in self._moved_characters:
+            location = self._get_character_location(self._characters[index])
+            if location != self._characters_state[index]:
+                self._characters_state[index] = location
+                characters[index] = location
+        self._moved_characters.clear()
+
+        # Таймер портала меняется каждый ход, пока портал активен,
+        # поэтому портал остаётся под наблюдением до сброса таймера.
+        portals: dict[int, int] = {}
+        for index in list(self._watched_portals):
+            time = self._get_portal_time(self._portals_keeper.portals[index])
+            if time != self._portals_state[index]:
+                self._portals_state[index] = time
+                portals[index] = time
+            if time < 0:
+                self._watched_portals.discard(index)
+
+        delta: dict[str, object] = {
+            "t": "d",
+            "tick": self._tick,
+            "clock": self._game_timer.current_time,
+        }
+        if characters:
+            delta["chars"] = characters
+        if portals:
+            delta["portals"] = portals
+        return delta
+
+    def _build_maze(self) -> dict[str, object]:
+        """Для каждой комнаты кодируются правая и нижняя перегородки."""
+        rows = [
+            "".join(
+                self._encode_boundary(room.boundary_right)
+                + self._encode_boundary(room.boundary_down)
+                for room in row
+            )
+            for row in self._level.rooms
+        ]
+
+        portals: list[tuple[int, int, str]] = []
+        for portal in self._portals_keeper.portals:
+            if portal.room_1 is None:
+                continue
+            x, y = portal.room_1.get_location()
+            side = "r" if portal.position is BoundaryPosition.VERTICAL else "d"
+            portals.append((x, y, side))
+
+        return {
+            "size": len(self._level.rooms),
+            "rows": rows,
+            "portals": portals,
+            "names": [character.name for character in self._characters],
+        }
+
+    def _remember_state(self) -> None:
+        self._characters_state = [
+            self._get_character_location(character)
+            for character in self._characters
+        ]
+        self._portals_state = [
+            self._get_portal_time(portal)
+            for portal in self._portals_keeper.portals
+        ]
+
+    @staticmethod
+    def _get_character_location(character: ICharacter) -> Optional[tuple[int, int]]:
+        if character.current_room is None:
+            return None
+        return character.current_room.get_location()
+
+    @staticmethod
+    def _get_portal_time(portal: Portal) -> int:
+        return portal.timer.current_time if portal.timer.is_active else -1
+
+    @staticmethod
+    def _encode_boundary(boundary: IBoundary | None) -> str:
+        if isinstance(boundary, Wall):
+            return "W"
+        if isinstance(boundary, Portal):
+            return "P"
+        if isinstance(boundary, Door):
+            return "D"
+        return "W"
+
+    @staticmethod
+    def _encode(message: dict[str, object]) -> str:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class _SpectatorConnection:
+    def __init__(self, connection: socket.socket, subscriber: SpectatorSubscriber):
+        self.socket = connection
+        self.subscriber = subscriber
+        # Байты, которые не поместились в буфер сокета.
+        self.unsent = bytearray()
+
+
+class SpectatorServer:
+    """Принимает подключения зрителей и отправляет им сообщения трансляции.
+    Подписывается на EventBus вместо SpectatorBroadcaster.
+    """
+    def __init__(self, broadcaster: SpectatorBroadcaster, port: int, host: str = "127.0.0.1"):
+        self._broadcaster = broadcaster
+        self._socket = socket.create_server((host, port))
+        self._socket.setblocking(False)
+        self._connections: list[_SpectatorConnection] = []
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._socket.getsockname()[:2]
+
+    def on_events(self, events: list[Event]) -> None:
+        self._accept()
+        self._broadcaster.on_events(events)
+        self._send()
+
+    def close(self) -> None:
+        for connection in self._connections:
+            self._disconnect(connection)
+        self._connections = []
+        self._socket.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except BlockingIOError:
+                return
+            connection.setblocking(False)
+            self._connections.append(
+                _SpectatorConnection(connection, self._broadcaster.subscribe())
+            )
+
+    def _send(self) -> None:
+        connected: list[_SpectatorConnection] = []
+        for connection in self._connections:
+            if connection.subscriber.is_dropped:
+                self._disconnect(connection)
+                continue
+
+            # Новые сообщения берутся из очереди, только когда старые отправлены целиком.
+            # Пока сокет не принимает данные, очередь растёт, и broadcaster сам
+            # переключит зрителя на ключевой кадр или отключит его.
+            if not connection.unsent:
+                for message in connection.subscriber.read():
+                    connection.unsent += message.encode("utf-8") + b"\n"
+
+            try:
+                if connection.unsent:
+                    sent = connection.socket.send(connection.unsent)
+                    del connection.unsent[:sent]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._disconnect(connection)
+                continue
+
+            connected.append(connection)
+
+        self._connections = connected
+
+    def _disconnect(self, connection: _SpectatorConnection) -> None:
+        self._broadcaster.unsubscribe(connection.subscriber)
+        connection.socket.close()
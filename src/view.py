@@ -1,14 +1,28 @@
-from typing import Callable, Optional
+from typing import Callable, Optional, TYPE_CHECKING
 
-from src.model.interface import IBoundary, BoundaryPosition, ILevel, IRoom, ICharacter, ITimer
+from src.model.interface import (
+    IBoundary, BoundaryPosition, Direction, ILevel, IRoom, ICharacter, ITimer
+)
 from src.model.level import Wall, Door, Portal, PortalsKeeper
 
+if TYPE_CHECKING:
+    from src.model.moves import MoveQueue
+    from src.model.visibility import CharacterVisibility
+
 
 class Controller:
     def __init__(self, character: ICharacter):
         self._character = character
         self._required_answers = "wasdvq"
+        self._directions = {
+            "w": Direction.UP,
+            "d": Direction.RIGHT,
+            "s": Direction.DOWN,
+            "a": Direction.LEFT,
+        }
         self.quit_action: Optional[Callable[..., None]] = None
+        self.visibility: Optional["CharacterVisibility"] = None
+        self.move_queue: Optional["MoveQueue"] = None
 
     def query_input_device(self):
 
@@ -31,7 +45,17 @@ class Controller:
 
         if answer == "q":
             if self.quit_action:
-                self.quit_action()
+                self.quit_action(self._character)
+            return
+
+        if answer == "v":
+            print("Ну ждите...\n")
+            return
+
+        if self.move_queue:
+            direction = self._directions.get(answer)
+            if direction is not None:
+                self.move_queue.submit(self._character, direction)
             return
 
         if answer == "w":
@@ -42,12 +66,12 @@ class Controller:
             self._character.try_to_go_down()
         elif answer == "a":
             self._character.try_to_go_left()
-        elif answer == "v":
-            print("Ну ждите...\n")
 
 
 class EndGameException(Exception):
-    pass
+    def __init__(self, surrendered_character: Optional[ICharacter] = None):
+        super().__init__()
+        self.surrendered_character = surrendered_character
 
 
 class LevelView:
@@ -69,6 +93,10 @@ class LevelView:
 
         self.characters_encounter_delegate: Callable[..., bool] | None = None
         self.game_times_up: Callable[..., bool] | None = None
+        self.tick_finished: Callable[..., None] | None = None
+        self.game_finished: Callable[..., None] | None = None
+        self.move_queue: Optional["MoveQueue"] = None
+        self.level_drawn: Callable[..., None] | None = None
 
     def show(self):
         try:
@@ -76,9 +104,16 @@ class LevelView:
                 self._player_turn(self._controller_1)
                 self._player_turn(self._controller_2)
 
+                if self.move_queue:
+                    self.move_queue.resolve()
+                    self._check_characters_encounter()
+
                 self._portals_keeper.try_to_open_portals()
                 self._game_timer.update()
 
+                if self.tick_finished:
+                    self.tick_finished()
+
                 if self.game_times_up:
                     if self.game_times_up():
                         self.quit()
@@ -87,18 +122,22 @@ class LevelView:
                     f"Осталось ходов: {self._game_timer.end_time - self._game_timer.current_time}"
                 )
 
-        except EndGameException:
+        except EndGameException as exception:
+            if self.game_finished:
+                self.game_finished(exception.surrendered_character)
             print("Игра закончена")
         finally:
             input()
 
-    def quit(self):
-        raise EndGameException()
+    def quit(self, surrendered_character: Optional[ICharacter] = None):
+        raise EndGameException(surrendered_character)
 
     def _player_turn(self, controller: Controller):
-        self._draw_level()
+        self._draw_level(controller.visibility)
         controller.query_input_device()
+        self._check_characters_encounter()
 
+    def _check_characters_encounter(self):
         if self.characters_encounter_delegate is None:
             return
 
@@ -106,23 +145,52 @@ class LevelView:
         if result:
             raise EndGameException()
 
-    def _draw_level(self):
+    def _draw_level(self, visibility: Optional["CharacterVisibility"] = None):
+        visible_rooms = None if visibility is None else visibility.visible_rooms
+
         for row in self._level.rooms:
-            print("┌" + "┐ ┌".join([self._draw_boundary(room.boundary_up) for room in row]) + "┐")
+            print(
+                "┌"
+                + "┐ ┌".join([
+                    self._draw_boundary(room.boundary_up, room, visible_rooms)
+                    for room in row
+                ])
+                + "┐"
+            )
             print(
                 " ".join([
-                    f"{self._draw_boundary(room.boundary_left)} "
-                    f"{self._draw_character(room)} "
-                    f"{self._draw_boundary(room.boundary_right)}"
+                    f"{self._draw_boundary(room.boundary_left, room, visible_rooms)} "
+                    f"{self._draw_character(room, visible_rooms)} "
+                    f"{self._draw_boundary(room.boundary_right, room, visible_rooms)}"
                     for room in row
                 ])
             )
-            print("└" + "┘ └".join([self._draw_boundary(room.boundary_down) for room in row]) + "┘")
+            print(
+                "└"
+                + "┘ └".join([
+                    self._draw_boundary(room.boundary_down, room, visible_rooms)
+                    for room in row
+                ])
+                + "┘"
+            )
+
+        if self.level_drawn:
+            self.level_drawn()
 
-    def _draw_boundary(self, boundary: IBoundary | None) -> str:
+    def _draw_boundary(
+        self,
+        boundary: IBoundary | None,
+        room: IRoom,
+        visible_rooms: Optional[set[IRoom]] = None
+    ) -> str:
         if boundary is None:
             raise Exception("Невозможно отрисовать несуществующую перегородку.")
 
+        if visible_rooms is not None and room not in visible_rooms:
+            if boundary.position is BoundaryPosition.HORIZONTAL:
+                return str("░░░")
+            return str("░")
+
         if boundary.position is BoundaryPosition.HORIZONTAL:
             if isinstance(boundary, Wall):
                 return str("═══")
@@ -140,7 +208,10 @@ class LevelView:
 
         raise Exception(f"Невозможно отрисовать перегородку с типом: {boundary}")
 
-    def _draw_character(self, room: IRoom):
+    def _draw_character(self, room: IRoom, visible_rooms: Optional[set[IRoom]] = None):
+        if visible_rooms is not None and room not in visible_rooms:
+            return "░"
+
         character = self._level.get_character_from_room(room)
 
         if character is None:
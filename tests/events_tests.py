@@ -0,0 +1,77 @@
+import unittest
+
+from src.model.events import (
+    CharacterMovedEvent,
+    Event,
+    EventBus,
+    GameOverEvent,
+    PortalArmedEvent,
+    PortalFiredEvent,
+    TimerTickedEvent,
+)
+from src.model.game_objects import Character, Timer
+from tests.helpers import create_rooms_with_portal
+
+
+class EventBusTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rooms, self.portal, self.portals_keeper = create_rooms_with_portal()
+        self.character = Character("Ripley")
+        self.character.change_room(self.rooms[0])
+        self.game_timer = Timer(10)
+        self.game_timer.start()
+
+        self.bus = EventBus()
+        self.bus.attach([self.character], self.portals_keeper.portals, [self.game_timer])
+        self.batches: list[list[Event]] = []
+        self.bus.subscribe(self.batches.append)
+
+    def test_events_are_delivered_in_one_batch_per_tick(self):
+        self.character.try_to_go_right()
+        self.portals_keeper.try_to_open_portals()
+        self.game_timer.update()
+
+        self.assertEqual(self.batches, [])
+
+        self.bus.flush()
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(
+            [type(event) for event in self.batches[0]],
+            [PortalArmedEvent, CharacterMovedEvent, PortalFiredEvent, TimerTickedEvent]
+        )
+        moved = self.batches[0][1]
+        assert isinstance(moved, CharacterMovedEvent)
+        self.assertIs(moved.previous_room, self.rooms[0])
+        self.assertIs(moved.room, self.rooms[1])
+
+    def test_subscriber_with_filter_gets_only_selected_events(self):
+        moves: list[list[Event]] = []
+        self.bus.subscribe(moves.append, CharacterMovedEvent)
+
+        self.game_timer.update()
+        self.bus.flush()
+        self.bus.publish_game_over()
+
+        self.assertEqual(moves, [])
+        self.assertEqual(len(self.batches), 2)
+        self.assertIsInstance(self.batches[1][0], GameOverEvent)
+
+    def test_unsubscribe(self):
+        self.bus.unsubscribe(self.batches.append)
+
+        self.bus.publish_game_over()
+
+        self.assertEqual(self.batches, [])
+
+    def test_attach_to_busy_delegate_is_rejected(self):
+        character = Character("Alien")
+        character.room_changed_delegate = lambda *args: None
+
+        with self.assertRaises(ValueError):
+            EventBus().attach([character], [], [])
+        with self.assertRaises(ValueError):
+            EventBus().attach([self.character], [], [])
+
+        self.bus.attach([self.character], self.portals_keeper.portals, [self.game_timer])
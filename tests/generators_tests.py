@@ -0,0 +1,118 @@
+import unittest
+
+from src.model.game_objects import Character
+from src.model.generators import (
+    KruskalMazeGenerator,
+    MazeLayout,
+    RecursiveDivisionMazeGenerator,
+    UniformMazeGenerator,
+    WilsonMazeGenerator,
+)
+from src.model.interface import BoundaryKind
+from src.model.level import Level, Portal, PortalsKeeper, Wall
+from src.model.tiled_generators import TiledMazeGenerator
+
+
+def count_reachable_rooms(layout: MazeLayout) -> int:
+    neighbours: dict[int, list[int]] = {}
+    for index in range(layout.boundaries_amount):
+        if layout.kinds[index] == BoundaryKind.WALL:
+            continue
+        room_1, room_2 = layout.get_rooms(index)
+        neighbours.setdefault(room_1, []).append(room_2)
+        neighbours.setdefault(room_2, []).append(room_1)
+
+    visited = {0}
+    stack = [0]
+    while stack:
+        for neighbour in neighbours.get(stack.pop(), []):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                stack.append(neighbour)
+    return len(visited)
+
+
+class MazeLayoutTests(unittest.TestCase):
+
+    def test_get_rooms(self):
+        layout = MazeLayout(3)
+
+        self.assertEqual(layout.get_rooms(layout.vertical_index(1, 2)), (7, 8))
+        self.assertEqual(layout.get_rooms(layout.horizontal_index(2, 1)), (5, 8))
+
+
+class MazeGeneratorsTests(unittest.TestCase):
+
+    def test_connected_generators_honor_ratios(self):
+        for generator_type in (
+            KruskalMazeGenerator,
+            WilsonMazeGenerator,
+            RecursiveDivisionMazeGenerator,
+        ):
+            with self.subTest(generator=generator_type.__name__):
+                layout = generator_type(walls_percent=25, seed=1).generate(20)
+
+                self.assertEqual(count_reachable_rooms(layout), 400)
+                self.assertEqual(
+                    layout.count(BoundaryKind.WALL),
+                    layout.boundaries_amount * 25 // 100
+                )
+
+    def test_uniform_generator_walls_quota(self):
+        layout = UniformMazeGenerator(walls_percent=10, seed=1).generate(20)
+
+        # Как в прежнем BoundaryGenerator, стена отбрасывается, только когда стен уже
+        # больше заданного процента, поэтому последняя стена может его превысить.
+        self.assertLessEqual(
+            layout.count(BoundaryKind.WALL),
+            layout.boundaries_amount * 10 // 100 + 1
+        )
+
+    def test_same_seed_same_layout(self):
+        layout_1 = WilsonMazeGenerator(seed=7).generate(15)
+        layout_2 = WilsonMazeGenerator(seed=7).generate(15)
+
+        self.assertEqual(layout_1.kinds, layout_2.kinds)
+
+    def test_impossible_ratios(self):
+        with self.assertRaises(ValueError):
+            KruskalMazeGenerator(walls_percent=70, portals_percent=40)
+
+    def test_level_uses_generator_layout(self):
+        portals_keeper = PortalsKeeper()
+        level = Level(
+            5,
+            Character("Ripley"),
+            Character("Alien"),
+            portals_keeper,
+            KruskalMazeGenerator(seed=3)
+        )
+
+        room = level.rooms[2][1]
+        self.assertEqual(
+            isinstance(room.boundary_right, Wall),
+            level.layout.get_kind(level.layout.vertical_index(1, 2)) is BoundaryKind.WALL
+        )
+        self.assertEqual(
+            len(portals_keeper.portals),
+            level.layout.count(BoundaryKind.PORTAL)
+        )
+        self.assertTrue(all(isinstance(portal, Portal) for portal in portals_keeper.portals))
+
+
+class TiledMazeGeneratorTests(unittest.TestCase):
+
+    def test_same_layout_for_any_workers_amount(self):
+        layout_1 = TiledMazeGenerator(tile_size=8, workers=1, seed=11).generate(30)
+        layout_2 = TiledMazeGenerator(tile_size=8, workers=2, seed=11).generate(30)
+
+        self.assertEqual(layout_1.kinds, layout_2.kinds)
+
+    def test_stitched_level_is_connected_and_honors_walls_quota(self):
+        layout = TiledMazeGenerator(tile_size=7, workers=1, seed=2).generate(30)
+
+        self.assertEqual(count_reachable_rooms(layout), 900)
+        self.assertEqual(
+            layout.count(BoundaryKind.WALL),
+            layout.boundaries_amount * 20 // 100
+        )
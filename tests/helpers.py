@@ -0,0 +1,30 @@
+from src.model.game_objects import Timer
+from src.model.interface import BoundaryPosition
+from src.model.level import Boundary, Point, Portal, PortalsKeeper, Room
+
+
+def link_horizontally(left: Room, right: Room, boundary: Boundary):
+    boundary.position = BoundaryPosition.VERTICAL
+    boundary.room_1 = left
+    boundary.room_2 = right
+    left.boundary_right = boundary
+    right.boundary_left = boundary
+
+
+def link_vertically(up: Room, down: Room, boundary: Boundary):
+    boundary.position = BoundaryPosition.HORIZONTAL
+    boundary.room_1 = up
+    boundary.room_2 = down
+    up.boundary_down = boundary
+    down.boundary_up = boundary
+
+
+def create_rooms_with_portal() -> tuple[list[Room], Portal, PortalsKeeper]:
+    """Комнаты (0, 0) ⁞ (1, 0), соединённые порталом с ожиданием в один ход."""
+    rooms = [Room(Point(0, 0)), Room(Point(1, 0))]
+    portal = Portal(Timer(1))
+    link_horizontally(rooms[0], rooms[1], portal)
+
+    portals_keeper = PortalsKeeper()
+    portals_keeper.add_portal(portal)
+    return rooms, portal, portals_keeper
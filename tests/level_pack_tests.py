@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from src.model.game_objects import Character
+from src.model.generators import KruskalMazeGenerator, PrecomputedMazeGenerator
+from src.model.level import Level, PortalsKeeper
+from src.model.level_pack import (
+    LevelPack,
+    LevelPackError,
+    build_level_pack,
+    write_level_pack,
+)
+
+
+class LevelPackTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "levels.pack")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_layouts_are_read_back_by_index(self):
+        layouts = [
+            (seed, KruskalMazeGenerator(seed=seed).generate(size))
+            for seed, size in ((1, 5), (2, 7), (3, 5))
+        ]
+        write_level_pack(self.path, layouts)
+
+        with LevelPack(self.path) as level_pack:
+            self.assertEqual(len(level_pack), 3)
+            self.assertEqual(level_pack.find_indexes(5), [0, 2])
+            self.assertEqual(level_pack.get_seed(1), 2)
+            self.assertEqual(level_pack.get_layout(2).kinds, layouts[2][1].kinds)
+            self.assertEqual(level_pack.get_layout(1).size, 7)
+
+    def test_built_levels_are_connected(self):
+        build_level_pack(self.path, 6, 5)
+
+        with LevelPack(self.path) as level_pack:
+            for index in range(len(level_pack)):
+                self.assertEqual(level_pack.get_layout(index).count_components(), 1)
+
+    def test_level_from_pack(self):
+        build_level_pack(self.path, 6, 1)
+
+        with LevelPack(self.path) as level_pack:
+            layout = level_pack.get_layout(0)
+            level = Level(
+                6,
+                Character("Ripley"),
+                Character("Alien"),
+                PortalsKeeper(),
+                PrecomputedMazeGenerator(layout)
+            )
+
+        self.assertIs(level.layout, layout)
+
+    def test_not_a_level_pack(self):
+        with open(self.path, "wb") as file:
+            file.write(b"something else")
+
+        with self.assertRaises(LevelPackError):
+            LevelPack(self.path)
@@ -1,42 +1,42 @@
 import unittest
 
-from src.model.level import BoundaryGenerator
+from src.model.generators import MazeLayout
 
 
-class BoundaryGeneratorTests(unittest.TestCase):
+class MazeLayoutTests(unittest.TestCase):
 
-    def test_calculate_internal_boundaries_amount_1(self):
+    def test_boundaries_amount_1(self):
         size = 1
         answer = 0
 
         self.assertEqual(
-            BoundaryGenerator._calculate_internal_boundaries_amount(size),  # type: ignore
+            MazeLayout(size).boundaries_amount,
             answer
         )
 
-    def test_calculate_internal_boundaries_amount_2(self):
+    def test_boundaries_amount_2(self):
         size = 2
         answer = 4
 
         self.assertEqual(
-            BoundaryGenerator._calculate_internal_boundaries_amount(size),  # type: ignore
+            MazeLayout(size).boundaries_amount,
             answer
         )
 
-    def test_calculate_internal_boundaries_amount_3(self):
+    def test_boundaries_amount_3(self):
         size = 3
         answer = 12
 
         self.assertEqual(
-            BoundaryGenerator._calculate_internal_boundaries_amount(size),  # type: ignore
+            MazeLayout(size).boundaries_amount,
             answer
         )
 
-    def test_calculate_internal_boundaries_amount_10(self):
+    def test_boundaries_amount_10(self):
         size = 10
         answer = 180
 
         self.assertEqual(
-            BoundaryGenerator._calculate_internal_boundaries_amount(size),  # type: ignore
+            MazeLayout(size).boundaries_amount,
             answer
         )
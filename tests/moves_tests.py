@@ -0,0 +1,115 @@
+import unittest
+
+from src.model.game_objects import Character, Timer
+from src.model.interface import Direction
+from src.model.level import Door, Point, Portal, PortalsKeeper, Room, Wall
+from src.model.moves import MoveQueue, TransitionTable
+from tests.helpers import link_horizontally
+
+
+class MoveQueueTests(unittest.TestCase):
+
+    def setUp(self):
+        # 0   1   2 ⁞ 3 | 4
+        self.rooms = [Room(Point(x, 0)) for x in range(5)]
+        self.portal = Portal(Timer(1))
+        link_horizontally(self.rooms[0], self.rooms[1], Door())
+        link_horizontally(self.rooms[1], self.rooms[2], Door())
+        link_horizontally(self.rooms[2], self.rooms[3], self.portal)
+        link_horizontally(self.rooms[3], self.rooms[4], Wall())
+
+        self.transitions = TransitionTable([self.rooms])
+        self.queue = MoveQueue(self.transitions)
+        self.ripley = Character("Ripley")
+        self.alien = Character("Alien")
+
+    def test_moves_do_not_depend_on_order(self):
+        for first, second in ((self.ripley, self.alien), (self.alien, self.ripley)):
+            with self.subTest(first=first.name):
+                self.ripley.change_room(self.rooms[0])
+                self.alien.change_room(self.rooms[1])
+
+                self.queue.submit(first, Direction.RIGHT)
+                self.queue.submit(second, Direction.RIGHT)
+                cancelled = self.queue.resolve()
+
+                self.assertEqual(cancelled, [])
+                self.assertIs(self.ripley.current_room, self.rooms[1])
+                self.assertIs(self.alien.current_room, self.rooms[2])
+
+    def test_head_on_moves_are_cancelled(self):
+        self.ripley.change_room(self.rooms[0])
+        self.alien.change_room(self.rooms[1])
+
+        self.queue.submit(self.ripley, Direction.RIGHT)
+        self.queue.submit(self.alien, Direction.LEFT)
+        cancelled = self.queue.resolve()
+
+        self.assertCountEqual(cancelled, [self.ripley, self.alien])
+        self.assertIs(self.ripley.current_room, self.rooms[0])
+        self.assertIs(self.alien.current_room, self.rooms[1])
+
+    def test_characters_can_meet_in_one_room(self):
+        self.ripley.change_room(self.rooms[0])
+        self.alien.change_room(self.rooms[2])
+
+        self.queue.submit(self.ripley, Direction.RIGHT)
+        self.queue.submit(self.alien, Direction.LEFT)
+        self.queue.resolve()
+
+        self.assertIs(self.ripley.current_room, self.rooms[1])
+        self.assertIs(self.alien.current_room, self.rooms[1])
+
+    def test_wall_and_outer_edge_keep_character(self):
+        self.ripley.change_room(self.rooms[3])
+        self.alien.change_room(self.rooms[0])
+
+        self.queue.submit(self.ripley, Direction.RIGHT)
+        self.queue.submit(self.alien, Direction.UP)
+        self.queue.resolve()
+
+        self.assertIs(self.ripley.current_room, self.rooms[3])
+        self.assertIs(self.alien.current_room, self.rooms[0])
+
+    def test_portal_waits_for_timer(self):
+        portals_keeper = PortalsKeeper()
+        portals_keeper.add_portal(self.portal)
+        self.ripley.change_room(self.rooms[2])
+
+        self.queue.submit(self.ripley, Direction.RIGHT)
+        self.queue.resolve()
+
+        self.assertIs(self.ripley.current_room, self.rooms[2])
+
+        portals_keeper.try_to_open_portals()
+
+        self.assertIs(self.ripley.current_room, self.rooms[3])
+
+    def test_contested_portal_is_not_entered(self):
+        self.ripley.change_room(self.rooms[2])
+        self.alien.change_room(self.rooms[3])
+
+        self.queue.submit(self.ripley, Direction.RIGHT)
+        self.queue.submit(self.alien, Direction.LEFT)
+        cancelled = self.queue.resolve()
+
+        self.assertCountEqual(cancelled, [self.ripley, self.alien])
+        self.assertFalse(self.portal.timer.is_active)
+
+    def test_move_outside_queue_and_cancel(self):
+        self.ripley.change_room(self.rooms[0])
+        self.queue.submit(self.ripley, Direction.RIGHT)
+        self.queue.resolve()
+
+        # Персонаж перемещён не через очередь, следующий ход считается от новой комнаты.
+        self.ripley.change_room(self.rooms[2])
+        self.queue.submit(self.ripley, Direction.LEFT)
+        self.queue.resolve()
+
+        self.assertIs(self.ripley.current_room, self.rooms[1])
+
+        self.queue.submit(self.ripley, Direction.LEFT)
+        self.queue.cancel(self.ripley)
+        self.queue.resolve()
+
+        self.assertIs(self.ripley.current_room, self.rooms[1])
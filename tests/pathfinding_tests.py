@@ -0,0 +1,84 @@
+import unittest
+
+from src.model.generators import KruskalMazeGenerator, MazeLayout
+from src.model.interface import BoundaryKind
+from src.model.pathfinding import HierarchicalPathPlanner
+
+
+def build_open_layout(size: int) -> MazeLayout:
+    layout = MazeLayout(size)
+    for index in range(layout.boundaries_amount):
+        layout.kinds[index] = BoundaryKind.DOOR
+    return layout
+
+
+class HierarchicalPathPlannerTests(unittest.TestCase):
+
+    def assert_valid_path(self, layout: MazeLayout, path: list[tuple[int, int]]):
+        for (x_1, y_1), (x_2, y_2) in zip(path, path[1:]):
+            self.assertEqual(abs(x_1 - x_2) + abs(y_1 - y_2), 1)
+            if y_1 == y_2:
+                index = layout.vertical_index(min(x_1, x_2), y_1)
+            else:
+                index = layout.horizontal_index(x_1, min(y_1, y_2))
+            self.assertNotEqual(layout.kinds[index], BoundaryKind.WALL)
+
+    def test_path_in_open_level_is_shortest(self):
+        layout = build_open_layout(12)
+        planner = HierarchicalPathPlanner(layout, cluster_size=4)
+
+        path = planner.find_path((0, 0), (11, 11))
+
+        assert path is not None
+        self.assertEqual(len(path), 23)
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (11, 11))
+        self.assert_valid_path(layout, path)
+
+    def test_path_in_connected_maze(self):
+        layout = KruskalMazeGenerator(seed=5).generate(30)
+        planner = HierarchicalPathPlanner(layout, cluster_size=8)
+
+        for start, goal in (((0, 0), (29, 29)), ((3, 27), (25, 1)), ((14, 14), (15, 14))):
+            with self.subTest(start=start, goal=goal):
+                path = planner.find_path(start, goal)
+
+                assert path is not None
+                self.assertEqual(path[0], start)
+                self.assertEqual(path[-1], goal)
+                self.assert_valid_path(layout, path)
+
+    def test_update_boundary_rebuilds_only_affected_clusters(self):
+        layout = build_open_layout(12)
+        planner = HierarchicalPathPlanner(layout, cluster_size=4)
+        untouched = planner._intra_edges[2]  # type: ignore
+
+        # Отрезаем левый столбец кластеров от остального уровня.
+        for y in range(12):
+            planner.update_boundary(layout.vertical_index(3, y), BoundaryKind.WALL)
+
+        self.assertIsNone(planner.find_path((0, 0), (11, 0)))
+        self.assertIs(planner._intra_edges[2], untouched)  # type: ignore
+
+        planner.update_boundary(layout.vertical_index(3, 6), BoundaryKind.PORTAL)
+        path = planner.find_path((0, 0), (11, 0))
+
+        assert path is not None
+        self.assertIn((3, 6), path)
+        self.assertIn((4, 6), path)
+
+    def test_update_boundary_along_cluster_border(self):
+        layout = build_open_layout(8)
+        planner = HierarchicalPathPlanner(layout, cluster_size=4)
+
+        # Стены под верхним рядом вдоль границы кластеров меняют участки входов границы.
+        for x in range(4):
+            planner.update_boundary(layout.horizontal_index(x, 0), BoundaryKind.WALL)
+        path = planner.find_path((0, 0), (7, 0))
+
+        assert path is not None
+        self.assertEqual(len(path), 8)
+        self.assert_valid_path(layout, path)
+
+        rebuilt_planner = HierarchicalPathPlanner(layout, cluster_size=4)
+        self.assertEqual(path, rebuilt_planner.find_path((0, 0), (7, 0)))
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from multiprocessing import Process
+
+from src.model.events import EventBus, GameOverEvent, PortalFiredEvent
+from src.model.game_objects import Character, GameRules, Timer
+from src.model.generators import KruskalMazeGenerator
+from src.model.level import Level, PortalsKeeper
+from src.results import MatchRecord, MatchRecorder, ResultsReader, ResultsWriter
+
+
+def write_records(path: str, winner: int, amount: int):
+    with ResultsWriter(path, batch_size=7) as writer:
+        for seed in range(amount):
+            writer.append(MatchRecord(seed, 10, 20, winner, 5))
+
+
+class ResultsStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.rrcs")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_records_are_read_back_by_columns(self):
+        with ResultsWriter(self.path, batch_size=2) as writer:
+            writer.append(MatchRecord(1, 10, 20, 2, 4, 37, 1))
+            writer.append(MatchRecord(2, 10, 20, 1, 10))
+            writer.append(MatchRecord(3, 20, 25, 2, 8, 5, 3))
+
+        reader = ResultsReader(self.path)
+        blocks = list(reader.iterate_columns(("seed", "encounter_room")))
+
+        self.assertEqual(len(reader), 3)
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual(list(blocks[0]["seed"]) + list(blocks[1]["seed"]), [1, 2, 3])
+        self.assertEqual(list(blocks[0]["encounter_room"]), [37, -1])
+        self.assertNotIn("winner", blocks[0])
+
+    def test_aggregates(self):
+        with ResultsWriter(self.path) as writer:
+            writer.append(MatchRecord(1, 10, 20, 2, 4))
+            writer.append(MatchRecord(2, 10, 20, 1, 10))
+            writer.append(MatchRecord(3, 10, 30, 2, 8))
+            writer.append(MatchRecord(4, 20, 20, 1, 10))
+
+        reader = ResultsReader(self.path)
+
+        self.assertEqual(
+            reader.win_rate_by(("size", "walls_percent"), winner=2),
+            {(10, 20): 0.5, (10, 30): 1.0, (20, 20): 0.0}
+        )
+        self.assertEqual(reader.count_by(("size",)), {(10,): 3, (20,): 1})
+
+    def test_unfinished_block_is_skipped(self):
+        write_records(self.path, 1, 3)
+        with open(self.path, "ab") as file:
+            file.write(b"RRCB\x05\x00\x00\x00\x01\x02")
+
+        self.assertEqual(len(ResultsReader(self.path)), 3)
+
+    def test_unfinished_block_is_truncated_by_next_writer(self):
+        write_records(self.path, 1, 3)
+        # Процесс завершился посреди записи блока на 5 записей.
+        with open(self.path, "ab") as file:
+            file.write(b"RRCB\x05\x00\x00\x00\x01\x02")
+        write_records(self.path, 2, 4)
+
+        reader = ResultsReader(self.path)
+
+        self.assertEqual(len(reader), 7)
+        self.assertEqual(reader.count_by(("winner",)), {(1,): 3, (2,): 4})
+        self.assertEqual(
+            [list(columns["seed"]) for columns in reader.iterate_columns(("seed",))],
+            [[0, 1, 2], [0, 1, 2, 3]]
+        )
+
+    def test_concurrent_writers(self):
+        processes = [
+            Process(target=write_records, args=(self.path, winner, 50))
+            for winner in (1, 2, 1)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        reader = ResultsReader(self.path)
+
+        self.assertEqual(len(reader), 150)
+        self.assertEqual(reader.count_by(("winner",)), {(1,): 100, (2,): 50})
+
+
+class MatchRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.rrcs")
+        self.ripley = Character("Ripley")
+        self.alien = Character("Alien")
+        self.game_timer = Timer(10)
+        self.game_rules = GameRules(self.game_timer, self.ripley, self.alien)
+        self.level = Level(
+            5, self.ripley, self.alien, PortalsKeeper(), KruskalMazeGenerator(seed=4)
+        )
+        self.event_bus = EventBus()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record_game_over(self, surrendered_character: Character | None = None):
+        with ResultsWriter(self.path) as writer:
+            recorder = MatchRecorder(
+                writer, self.level, 4, self.game_rules, self.game_timer, self.ripley
+            )
+            self.event_bus.subscribe(recorder.on_events, PortalFiredEvent, GameOverEvent)
+            self.event_bus.publish_game_over(surrendered_character)
+
+        reader = ResultsReader(self.path)
+        return next(reader.iterate_columns(("seed", "size", "winner", "encounter_room")))
+
+    def test_encounter_is_recorded_as_second_character_win(self):
+        self.ripley.change_room(self.level.rooms[1][3])
+        self.alien.change_room(self.level.rooms[1][3])
+
+        columns = self.record_game_over()
+
+        self.assertEqual(list(columns["seed"]), [4])
+        self.assertEqual(list(columns["size"]), [5])
+        self.assertEqual(list(columns["winner"]), [2])
+        self.assertEqual(list(columns["encounter_room"]), [8])
+
+    def test_surrender_is_recorded_as_another_character_win(self):
+        self.ripley.change_room(self.level.rooms[0][0])
+        self.alien.change_room(self.level.rooms[4][4])
+
+        columns = self.record_game_over(self.ripley)
+
+        self.assertEqual(list(columns["winner"]), [2])
+        self.assertEqual(list(columns["encounter_room"]), [-1])
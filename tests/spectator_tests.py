@@ -0,0 +1,118 @@
+import json
+import socket
+import unittest
+
+from src.model.events import EventBus
+from src.model.game_objects import Character, Timer
+from src.model.level import Level, PortalsKeeper
+from src.spectator import SpectatorBroadcaster, SpectatorServer
+
+
+class SpectatorBroadcasterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.character_1 = Character("Ripley")
+        self.character_2 = Character("Alien")
+        self.game_timer = Timer(10)
+        self.portals_keeper = PortalsKeeper()
+        self.level = Level(4, self.character_1, self.character_2, self.portals_keeper)
+        self.broadcaster = SpectatorBroadcaster(
+            self.level,
+            self.portals_keeper,
+            self.game_timer,
+            [self.character_1, self.character_2],
+            max_pending=2,
+            max_resyncs=1
+        )
+        self.event_bus = EventBus()
+        self.event_bus.attach([self.character_1, self.character_2], [], [self.game_timer])
+        self.event_bus.subscribe(self.broadcaster.on_events)
+
+    def _tick(self):
+        self.game_timer.update()
+        self.event_bus.flush()
+
+    def test_first_message_is_keyframe_then_deltas(self):
+        subscriber = self.broadcaster.subscribe()
+        self.game_timer.start()
+        self.character_1.change_room(self.level.rooms[1][1])
+        self.character_2.change_room(self.level.rooms[2][2])
+
+        self._tick()
+        self.character_1.change_room(self.level.rooms[0][0])
+        self.character_2.change_room(self.level.rooms[3][3])
+        self._tick()
+
+        keyframe, delta = [json.loads(message) for message in subscriber.read()]
+        self.assertEqual(keyframe["t"], "k")
+        self.assertEqual(keyframe["maze"]["size"], 4)
+        self.assertEqual(len(keyframe["maze"]["rows"]), 4)
+        self.assertEqual(delta["t"], "d")
+        self.assertEqual(delta["clock"], 2)
+        self.assertEqual(delta["chars"], {"0": [0, 0], "1": [3, 3]})
+
+    def test_delta_without_changes_has_only_clock(self):
+        subscriber = self.broadcaster.subscribe()
+        self._tick()
+        subscriber.read()
+
+        self._tick()
+
+        delta = json.loads(subscriber.read()[0])
+        self.assertEqual(set(delta), {"t", "tick", "clock"})
+
+    def test_slow_subscriber_is_resynced_then_dropped(self):
+        subscriber = self.broadcaster.subscribe()
+
+        self._tick()
+        self._tick()
+        self._tick()
+
+        self.assertEqual(subscriber.resyncs, 1)
+        self.assertEqual(json.loads(subscriber.read()[0])["t"], "k")
+
+        for _ in range(4):
+            self._tick()
+
+        self.assertTrue(subscriber.is_dropped)
+        self.assertNotIn(subscriber, self.broadcaster.subscribers)
+
+    def test_delta_has_only_moved_characters(self):
+        subscriber = self.broadcaster.subscribe()
+        self.character_1.change_room(self.level.rooms[2][2])
+        self.game_timer.start()
+        self.event_bus.flush()
+
+        self.character_1.change_room(self.level.rooms[0][0])
+        self.character_1.change_room(self.level.rooms[0][1])
+        self._tick()
+
+        keyframe, delta = [json.loads(message) for message in subscriber.read()]
+        self.assertEqual(keyframe["t"], "k")
+        self.assertEqual(delta["clock"], 1)
+        self.assertEqual(delta["chars"], {"0": [1, 0]})
+
+
+class SpectatorServerTests(unittest.TestCase):
+
+    def test_spectator_receives_json_lines(self):
+        character_1 = Character("Ripley")
+        character_2 = Character("Alien")
+        game_timer = Timer(10)
+        portals_keeper = PortalsKeeper()
+        level = Level(4, character_1, character_2, portals_keeper)
+        broadcaster = SpectatorBroadcaster(
+            level, portals_keeper, game_timer, [character_1, character_2]
+        )
+        server = SpectatorServer(broadcaster, 0)
+        self.addCleanup(server.close)
+
+        with socket.create_connection(server.address, timeout=5) as client:
+            server.on_events([])
+            server.on_events([])
+
+            with client.makefile("rb") as stream:
+                messages = [json.loads(stream.readline()) for _ in range(2)]
+
+        self.assertEqual([message["t"] for message in messages], ["k", "d"])
+        self.assertEqual(len(broadcaster.subscribers), 1)
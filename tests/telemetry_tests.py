@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from src.model.events import CharacterMovedEvent, EventBus, PortalFiredEvent
+from src.model.game_objects import Character
+from src.model.generators import MazeLayout
+from src.model.level import Door, Point, Room
+from src.model.telemetry import HeatmapTelemetry
+from tests.helpers import create_rooms_with_portal, link_vertically
+
+
+class HeatmapTelemetryTests(unittest.TestCase):
+
+    def setUp(self):
+        # (0, 0) ⁞ (1, 0)
+        #    |
+        # (0, 1)
+        self.layout = MazeLayout(2)
+        self.rooms, self.portal, self.portals_keeper = create_rooms_with_portal()
+        self.rooms.append(Room(Point(0, 1)))
+        link_vertically(self.rooms[0], self.rooms[2], Door())
+
+        self.character = Character("Ripley")
+        self.telemetry = HeatmapTelemetry(self.layout)
+        self.bus = EventBus()
+        self.bus.attach([self.character], self.portals_keeper.portals, [])
+        self.bus.subscribe(self.telemetry.on_events, CharacterMovedEvent, PortalFiredEvent)
+
+    def test_counts_visits_and_passes(self):
+        self.character.change_room(self.rooms[2])
+        self.character.try_to_go_up()
+        self.character.try_to_go_right()
+        self.portals_keeper.try_to_open_portals()
+        self.bus.flush()
+
+        self.assertIs(self.character.current_room, self.rooms[1])
+        self.assertEqual(self.telemetry.get_rooms_heatmap(), [[1, 1], [1, 0]])
+        self.assertEqual(
+            self.telemetry.boundary_passes[self.layout.horizontal_index(0, 0)], 1
+        )
+        self.assertEqual(
+            self.telemetry.boundary_passes[self.layout.vertical_index(0, 0)], 1
+        )
+        self.assertEqual(self.telemetry.portal_uses[self.layout.vertical_index(0, 0)], 1)
+
+    def test_merge_serialized_counters(self):
+        self.character.change_room(self.rooms[2])
+        self.character.try_to_go_up()
+        self.bus.flush()
+
+        merged = HeatmapTelemetry(self.layout)
+        merged.merge(HeatmapTelemetry.from_bytes(self.layout, self.telemetry.to_bytes()))
+        merged.merge(self.telemetry)
+
+        self.assertEqual(merged.get_rooms_heatmap(), [[2, 0], [2, 0]])
+        self.assertEqual(merged.boundary_passes[self.layout.horizontal_index(0, 0)], 2)
+
+    def test_save_rooms_heatmap_image(self):
+        self.character.change_room(self.rooms[1])
+        self.bus.flush()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "heatmap.pgm")
+            self.telemetry.save_rooms_heatmap_image(path)
+            with open(path, "rb") as file:
+                data = file.read()
+
+        self.assertEqual(data, b"P5\n2 2\n255\n\x00\xff\x00\x00")
@@ -0,0 +1,47 @@
+import unittest
+
+from src.model.game_objects import Character, Timer
+from src.model.level import Door, Point, Portal, Room, Wall
+from src.model.visibility import CharacterVisibility, SightSpansCache
+from tests.helpers import link_horizontally, link_vertically
+
+
+class CharacterVisibilityTests(unittest.TestCase):
+
+    def setUp(self):
+        # 0 | 1   2 ⁞ 3
+        #     =
+        #     4
+        self.rooms = [Room(Point(x, 0)) for x in range(4)]
+        link_horizontally(self.rooms[0], self.rooms[1], Wall())
+        link_horizontally(self.rooms[1], self.rooms[2], Door())
+        link_horizontally(self.rooms[2], self.rooms[3], Portal(Timer(2)))
+
+        self.rooms.append(Room(Point(1, 1)))
+        link_vertically(self.rooms[1], self.rooms[4], Door())
+
+        self.character = Character("Ripley")
+        self.visibility = CharacterVisibility(self.character, SightSpansCache())
+
+    def test_wall_blocks_sight_and_portal_gives_glimpse(self):
+        self.character.change_room(self.rooms[1])
+
+        self.assertEqual(
+            self.visibility.visible_rooms,
+            {self.rooms[1], self.rooms[2], self.rooms[3], self.rooms[4]}
+        )
+
+    def test_visible_rooms_follow_character(self):
+        self.character.change_room(self.rooms[1])
+        self.visibility.update()
+
+        self.character.try_to_go_right()
+
+        self.assertIs(self.character.current_room, self.rooms[2])
+        self.assertEqual(
+            self.visibility.visible_rooms,
+            {self.rooms[1], self.rooms[2], self.rooms[3]}
+        )
+
+    def test_no_room_no_visible_rooms(self):
+        self.assertEqual(self.visibility.visible_rooms, set())